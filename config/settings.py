@@ -88,6 +88,7 @@ DEFAULT_VIDEO_PATH = "videos/"
 
 # Camera Settings
 CAMERA_EXPOSURE = 0.01  # Default exposure time (seconds)
+VIDEO_FOURCC = "MJPG"   # Recording codec; MJPG encodes fastest, "XVID" gives smaller files
 
 # Voltage/Current Scaling Factors (Sorensen DLM 300-2 specifications)
 VOLTAGE_SCALE_OUTPUT = 60    # 300V/5V = 60V per volt (matches MATLAB: voltage * 5/300)
@@ -108,7 +109,8 @@ PLOTTING_CONFIG = {
     "plot_update_rate": 10,         # 10 Hz = 100ms plot updates
     
     # Data management
-    "max_data_points": 2000,        # Maximum points to store (100 seconds at 20 Hz)
+    # Maximum points to store: 100 seconds of samples at the batched flash-stage rate (100 Hz)
+    "max_data_points": round(100 / TIMER_PERIODS["data_flash"]),
     "plot_window_seconds": 30,      # Time window to display (seconds)
     
     # Compressed Timeline Settings
@@ -129,7 +131,7 @@ PLOTTING_CONFIG = {
     "grid_minor_alpha": 0.6,
     
     # Performance optimizations
-    "use_antialiasing": True,       # Enable line antialiasing
+    "use_antialiasing": False,      # Aliased live traces render much faster in Agg
     "use_draw_idle": True,          # Use optimized canvas updates
     "axis_auto_scale": True,        # Enable dynamic axis scaling
     "axis_padding_percent": 10      # Padding around data (percentage)
@@ -46,6 +46,7 @@ class DeviceController:
         self.ai_task = None
         self.ao_task = None
         self.keithley = None
+        self._keithley_buffered = True  # Cleared for good once the buffer commands are rejected
 
         # Experiment state
         self.current_stage = STAGES["DWELL"]
@@ -313,6 +314,127 @@ class DeviceController:
             self.logger.error(f"Error getting measurements: {e}")
             return None, None, None
 
+    def get_measurements_batch(self, n, sample_dt):
+        """Get n voltage/current samples with one round-trip per instrument.
+        The two instruments are read one after the other, so each array comes with the
+        time.time() stamps of its own acquisition window.
+        Args:
+            n (int): Number of samples to read
+            sample_dt (float): Spacing between voltage samples in seconds
+        Returns:
+            tuple: (voltage, current, voltage_times, current_times) arrays in volts, milliamps
+                   and seconds, or (None, None, None, None)
+        """
+        try:
+            voltage = self.read_sample_voltage_batch(n, sample_dt)
+            v_end = i_start = time.time()
+            current = self.read_keithley_current_batch(n)
+            i_end = time.time()
+            if voltage is None or current is None or len(current) != n:
+                return None, None, None, None
+            
+            # The finite DAQ read returns once its last sample is clocked in, so the voltage
+            # window ends at v_end; each reading is centred in its sample_dt slot
+            slots = np.arange(n) + 0.5
+            voltage_times = v_end - n * sample_dt + slots * sample_dt
+            # Keithley readings are paced by the meter; spread them over the measured window
+            current_times = i_start + slots * ((i_end - i_start) / n)
+            return voltage, current, voltage_times, current_times
+            
+        except Exception as e:
+            self.logger.error(f"Error getting batched measurements: {e}")
+            return None, None, None, None
+
+    def read_sample_voltage_batch(self, n, sample_dt, daq_range=5.0, actual_range=300.0):
+        """
+        Reads n sample voltages in a single finite DAQ acquisition
+        
+        Args:
+            n (int): Number of voltage readings
+            sample_dt (float): Spacing between readings in seconds
+            daq_range (float): The input range of the DAQ in Volts (e.g., 5.0 for ±5V)
+            actual_range (float): The actual voltage range across the sample (e.g., 300.0 for 300V)
+
+        Returns:
+            numpy.ndarray: voltages in Volts, or None on error
+        """
+        if not NIDAQMX_AVAILABLE:
+            self.logger.error("DAQ not available")
+            return None
+        try:
+            with nidaqmx.Task() as task:
+                task.ai_channels.add_ai_voltage_chan(
+                    physical_channel="Dev1/ai1",  # Using ai1 for voltage measurement
+                    terminal_config=nidaqmx.constants.TerminalConfiguration.RSE,
+                    min_val=-daq_range,
+                    max_val=daq_range
+                )
+                
+                # Two raw samples per reading, averaged like read_sample_voltage_improved
+                task.timing.cfg_samp_clk_timing(
+                    rate=2.0 / sample_dt,
+                    sample_mode=nidaqmx.constants.AcquisitionType.FINITE,
+                    samps_per_chan=2 * n
+                )
+                voltage_raw = np.asarray(task.read(number_of_samples_per_channel=2 * n,
+                                                   timeout=n * sample_dt + 1.0))
+            return (actual_range / daq_range) * voltage_raw.reshape(n, 2).mean(axis=1)
+            
+        except Exception as e:
+            self.logger.error(f"Error during batched voltage measurement: {str(e)}")
+            return None
+
+    def read_keithley_current_batch(self, n):
+        """
+        Reads n currents from the Keithley reading buffer in one transfer
+        
+        Falls back to n single reads if the instrument rejects the buffer commands, and keeps
+        using single reads from then on.
+
+        Returns:
+            numpy.ndarray: currents in milliamps, or None if not available
+        """
+        keithley = self.daq_controller.keithley
+        if not PYVISA_AVAILABLE or not keithley:
+            self.logger.error("Keithley not available")
+            return None
+
+        if self._keithley_buffered:
+            count_set = False
+            try:
+                # Same status check the single-read path does, once per batch
+                if not self.daq_controller.check_keithley_status():
+                    self.logger.warning("Keithley status check failed, attempting to reconfigure")
+                    if not self.daq_controller.configure_keithley_current():
+                        raise RuntimeError("Failed to reconfigure Keithley")
+                
+                # Fill the default reading buffer with n triggered readings, then fetch them all
+                keithley.write(':TRAC:CLE "defbuffer1"')
+                keithley.write(f':COUN {n}')
+                count_set = True
+                keithley.write(':TRAC:TRIG "defbuffer1"')
+                keithley.write('*WAI')
+                data = keithley.query(f':TRAC:DATA? 1, {n}, "defbuffer1"')
+                return np.array(data.split(','), dtype=np.float64) * 1000.0  # A to mA
+                
+            except Exception as e:
+                # Retrying every period would cost a query timeout and leave errors queued
+                # on the instrument each time, so fall back to single reads for good
+                self._keithley_buffered = False
+                self.logger.warning(f"Buffered Keithley read failed, using single reads from now on: {e}")
+                
+            finally:
+                if count_set:
+                    try:
+                        keithley.write(':COUN 1')  # Single reads expect one reading per trigger
+                    except Exception as e:
+                        self.logger.error(f"Error restoring Keithley trigger count: {e}")
+        
+        currents = [self.read_keithley_current_improved()[0] for _ in range(n)]
+        if any(current is None for current in currents):
+            return None
+        return np.array(currents)
+
     def read_sample_voltage_improved(self, daq_range=5.0, actual_range=300.0):
         """
         Reads voltage measurement across the sample using improved DAQ method
@@ -456,7 +578,8 @@ class DeviceController:
         except Exception as e:
             self.logger.error(f"Error stopping process: {e}")
 
-    def update_stage(self, dwell_time, hold_current, current_limit, hold_time, target_temperature=None):
+    def update_stage(self, dwell_time, hold_current, current_limit, hold_time, target_temperature=None,
+                     measurements=None):
         """Update the experiment stage based on current conditions.
         Enhanced to match MATLAB implementation with sub-staging and hold time control.
         Args:
@@ -465,12 +588,16 @@ class DeviceController:
             current_limit (float): Current limit in mA
             hold_time (float): Hold time limit in seconds
             target_temperature (float): Target temperature for starting (optional)
+            measurements (tuple): (voltage, current, temperature) already read by the caller;
+                                  the instruments are read here if omitted
         """
         if not self.is_running:
             return
 
         current_time = time.time() - self.start_time
-        voltage, current, temperature = self.get_measurements()
+        if measurements is None:
+            measurements = self.get_measurements()
+        voltage, current, temperature = measurements
 
         # Detect CV/CC power supply mode transitions
         if voltage is not None and current is not None:
@@ -3,6 +3,7 @@
 from .device_controller import DeviceController
 from .timer_manager import TimerManager
 from config.settings import TIMER_PERIODS, STAGES
+from utils.helpers import compute_setpoints
 
 class MainController:
     """Main controller coordinating all system components.
@@ -120,6 +121,14 @@ class MainController:
             self.timer_manager.update_period("data", TIMER_PERIODS["data_standard"])
             self.timer_manager.update_period("display", TIMER_PERIODS["display_standard"])
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stop any running experiment and release the devices."""
+        self.cleanup()
+        return False
+
     def cleanup(self):
         """Clean up system resources."""
         self.stop_experiment()
@@ -134,8 +143,8 @@ class MainController:
             electric_field (float): Electric field in V/cm
             current_density (float): Current density in mA/mm²
         """
-        voltage = electric_field * electrical_distance
-        current = current_density * width * thickness
+        voltage, current = compute_setpoints(electrical_distance, width, thickness,
+                                             electric_field, current_density)
         self.device_controller.set_voltage_current_limits(voltage, current) 
         
     def update_hold_time(self, hold_time):
@@ -8,12 +8,19 @@ import time
 import logging
 from tkinter import filedialog
 from datetime import datetime
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use('TkAgg')  # Select the backend up front instead of autodetecting it
+import matplotlib.style
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
 import numpy as np
+from scipy.interpolate import PchipInterpolator
 import tkinter.messagebox as messagebox
-# Queue removed - using arrays for better real-time plotting performance
+import queue
+from collections import deque
+from itertools import starmap
 import threading
+import contextlib
 import serial
 from serial.tools import list_ports
 
@@ -23,42 +30,84 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # Import flash control modules
 from controllers.main_controller import MainController
 from utils.logger import setup_logger
-from config.settings import PLOTTING_CONFIG
+from utils.helpers import compute_setpoints, compress_timeline
+from config.settings import PLOTTING_CONFIG, VIDEO_FOURCC, TIMER_PERIODS
+
+# Live traces: let Agg collapse collinear segments and split long paths
+matplotlib.style.use('fast')
+matplotlib.rcParams['path.simplify'] = True
+matplotlib.rcParams['path.simplify_threshold'] = 1.0
+matplotlib.rcParams['agg.path.chunksize'] = 10000
 
 class FlashSinterGUI:
-    def __init__(self):
-        """Initialize the GUI."""
+    # Pre-encoded Arduino stage commands
+    _CMD_FWD = b"FWD\n"
+    _CMD_REV = b"REV\n"
+    _CMD_STOP = b"STOP\n"
+    
+    # Data file row format, looked up once instead of parsing an f-string per sample
+    _ROW_FMT = "{:.3f}\t{:.3f}\t{:.3f}\n".format
+    
+    # Write buffer for experiment data and export files
+    WRITE_BUF = 1 << 20
+    
+    # Number of condition change markers kept on the plot
+    CC_MARKER_SLOTS = 5
+
+    def __init__(self, exit_stack=None):
+        """Initialize the GUI.
+        
+        Args:
+            exit_stack: contextlib.ExitStack that owns hardware cleanup (a private one if None)
+        """
+        self._exit_stack = exit_stack if exit_stack is not None else contextlib.ExitStack()
         self.root = Tk()
+        self._after_tokens = {}  # Pending Tk after() callbacks by key, see _schedule()
         self.setup_window()
         self.setup_controller()
         self.create_gui_elements()
-       
+        
+        # Render the plot canvas once; all later updates go through draw_idle()
+        self.canvas.draw()
+        
         # Initialize serial connection
         self.arduino = None
+        self._last_rpm_sent = None  # Last RPM written to the Arduino
         self.setup_serial()
        
-        # Data queues no longer needed - using arrays for better performance
+        # Acquisition runs on a worker thread and hands samples to the Tk thread via a queue
+        self._acq_thread = None
+        self._acq_stop = threading.Event()
+        self._device_lock = threading.Lock()  # Serializes instrument access between threads
+        self._file_lock = threading.RLock()   # Guards data_file and the row buffer
+        self.data_file = None  # Open experiment data file while acquiring
+        
+        # CV/CC status is polled on every drain; bind the getter once and log only on change
+        self._get_power_supply_status = getattr(self.controller.device_controller, 'get_power_supply_status', None)
+        self._last_mode = None
+        self._last_mode_log = 0.0
+       
+        # Released in reverse order on close: worker, stage motor, data file, camera, then devices
+        self._exit_stack.callback(self._release_camera)
+        self._exit_stack.callback(self._close_data_file)
+        self._exit_stack.callback(self._close_serial)
+        self._exit_stack.callback(self._stop_acq_thread)
        
-        # Initialize timers
-        self.control_timer = None
-        self.data_timer = None
-        self.display_timer = None
         self.is_plotting = False
        
         # Initialize timers with optimized periods for smooth plotting
         self.control_period = 50   # 50ms for control
         self.data_period = 50      # 50ms for data acquisition (20 Hz)  
-        self.display_period = 100  # 100ms for display updates (10 Hz)
+        self.display_period = 200  # 200ms for plot redraws (5 Hz), on their own timer
        
-        # Data storage for smooth plotting
-        self.voltage_data = []
-        self.current_data = []
-        self.time_data = []
+        # Data storage for smooth plotting (fixed-size ring buffers)
         self.max_data_points = PLOTTING_CONFIG["max_data_points"]
+        self._reset_buffers()
         
         # Plot smoothing parameters
         self.smoothing_window = PLOTTING_CONFIG["smoothing_window"]
-        self.plot_update_counter = 0
+        self._unit_grid = np.empty(0)  # Cached linspace(0, 1, n) for the interpolation grid
+        self._plot_dirty = False  # New samples since the last plot refresh
         
         # Compressed timeline parameters
         self.focus_window = PLOTTING_CONFIG["focus_window_seconds"]
@@ -71,6 +120,10 @@ class FlashSinterGUI:
         # Initialize data file path
         self.data_filepath = None
         
+        # Data rows are buffered as (time, voltage, current) and formatted in batches
+        self._row_buf = []
+        self._row_buf_limit = 50  # 0.5 s of samples at 100 rows/s
+        
         # Initialize hold time
         self.hold_time = 60.0  # Default hold time in seconds
        
@@ -83,8 +136,7 @@ class FlashSinterGUI:
         hold_time = 60.0  # s (NEW: Default hold time)
        
         # Calculate voltage and current
-        voltage = e_field * elec_d
-        current = curr_dens * width * thickness
+        voltage, current = compute_setpoints(elec_d, width, thickness, e_field, curr_dens)
        
         # Set initial voltage and current in entries
         self.voltage_entry.delete(0, END)
@@ -120,12 +172,29 @@ class FlashSinterGUI:
         self.root.maxsize(self.screen_width, self.screen_height)
         # Modern professional color scheme
         self.root.configure(bg="#f8f9fa")  # Light gray background
+        self.setup_styles()
        
         # Calculate coordinates
         self.calculate_coordinates()
        
+    def setup_styles(self):
+        """Create the shared ttk style used by all neumorphic buttons."""
+        self.style = ttk.Style(self.root)
+        # 'clam' honours background colours on every platform (native themes ignore them).
+        # theme_use() is application-wide: every ttk widget, including the comboboxes,
+        # is drawn by clam from here on, not just the neumorphic buttons
+        self.style.theme_use('clam')
+        self.style.configure('Neumo.TButton', background="#e0e5ec", foreground="#333333",
+                             font=("Arial", 14, "bold"), relief="flat", borderwidth=1,
+                             bordercolor="#babecc", lightcolor="#ffffff", darkcolor="#babecc",
+                             focuscolor="#e0e5ec", padding=2, anchor="center", justify="center")
+        self.style.map('Neumo.TButton',
+                       background=[('disabled', "#f5f5f5"), ('active', "#d1d9e6")],
+                       foreground=[('disabled', "#9e9e9e")])
+        self._neumorphic_styles = {}
+       
     def setup_controller(self):
-        self.controller = MainController()
+        self.controller = self._exit_stack.enter_context(MainController())
         self.logger = setup_logger(__name__)
        
     def calculate_coordinates(self):
@@ -227,7 +296,8 @@ class FlashSinterGUI:
         button.bind("<Leave>", on_leave)
         return button
        
-    def create_entry(self, parent, x, y, width, height, bg_color="#f8f9fa", font_size=11, border_color="#ced4da"):
+    def create_entry(self, parent, x, y, width, height, bg_color="#f8f9fa", font_size=11, border_color="#ced4da",
+                     textvariable=None):
         """Create a modern styled entry field."""
         def validate_float(P):
             if P == "":
@@ -242,7 +312,7 @@ class FlashSinterGUI:
         entry = Entry(parent, bg=bg_color, font=("Segoe UI", font_size),
                      validate="key", validatecommand=vcmd, relief="flat",
                      highlightbackground=border_color, highlightthickness=1,
-                     bd=1, fg="#2c3e50", justify="center")
+                     bd=1, fg="#2c3e50", justify="center", textvariable=textvariable)
         entry.place(x=x, y=y, width=width, height=height)
         return entry
        
@@ -254,105 +324,64 @@ class FlashSinterGUI:
         return combobox
        
     def create_neumorphic_button(self, parent, x, y, text, width, height, bg_color="#e0e5ec", 
-                                fg_color="#333333", font_size=14, command=None):
-        """Create a neumorphic style button with soft shadows and depth."""
-        # Create shadow frame (appears behind and slightly offset)
-        shadow_frame = Frame(parent, bg="#babecc", highlightthickness=0)
-        shadow_frame.place(x=x+3, y=y+3, width=width, height=height)
-        
-        # Create highlight frame (appears behind and slightly offset in opposite direction)
-        highlight_frame = Frame(parent, bg="#ffffff", highlightthickness=0)
-        highlight_frame.place(x=x-2, y=y-2, width=width, height=height)
-        
-        # Create the main button container frame
-        button_frame = Frame(parent, bg=bg_color, highlightthickness=0)
-        button_frame.place(x=x, y=y, width=width, height=height)
-        
-        # Create the actual button with neumorphic styling
-        button = Button(
-            button_frame,
-            text=text,
-            font=("Arial", font_size, "bold"),
-            bg=bg_color,
-            fg=fg_color,
-            activebackground="#d1d9e6",
-            activeforeground=fg_color,
-            relief="flat",
-            borderwidth=0,
-            highlightthickness=0,
-            command=command
-        )
-        button.pack(fill="both", expand=True, padx=2, pady=2)
-        
-        # Store references for later color changes
-        button.shadow_frame = shadow_frame
-        button.highlight_frame = highlight_frame
-        button.button_frame = button_frame
-        button.default_bg = bg_color
-        
-        # Add neumorphic hover effects
-        def on_enter_neuro(e):
-            button.configure(bg="#d1d9e6")
-            button_frame.configure(bg="#d1d9e6")
-            
-        def on_leave_neuro(e):
-            button.configure(bg=bg_color)
-            button_frame.configure(bg=bg_color)
-            
-        button.bind("<Enter>", on_enter_neuro)
-        button.bind("<Leave>", on_leave_neuro)
+                                fg_color="#333333", font_size=14, command=None, hover_color="#d1d9e6"):
+        """Create a neumorphic style button drawn by the shared 'Neumo.TButton' ttk style."""
+        button = ttk.Button(parent, text=text, command=command, cursor="hand2",
+                            style=self.neumorphic_style(bg_color, fg_color, font_size, hover_color))
+        button.place(x=x, y=y, width=width, height=height)
         
+        # Store font size for later colour changes
+        button.font_size = font_size
         return button
     
+    def neumorphic_style(self, bg_color, fg_color, font_size, hover_color="#d1d9e6"):
+        """Return the ttk style name for a neumorphic colour scheme, registering it on first use."""
+        key = (bg_color, fg_color, font_size, hover_color)
+        style_name = self._neumorphic_styles.get(key)
+        if style_name is None:
+            style_name = f"N{len(self._neumorphic_styles)}.Neumo.TButton"
+            self.style.configure(style_name, background=bg_color, foreground=fg_color,
+                                 focuscolor=bg_color, font=("Arial", font_size, "bold"))
+            self.style.map(style_name,
+                           background=[('disabled', "#f5f5f5"), ('active', hover_color)],
+                           foreground=[('disabled', "#9e9e9e")])
+            self._neumorphic_styles[key] = style_name
+        return style_name
+    
+    def set_neumorphic_colors(self, button, bg_color, fg_color, hover_color="#d1d9e6"):
+        """Switch a neumorphic button to another colour scheme (hover colour included)."""
+        button.configure(style=self.neumorphic_style(bg_color, fg_color, button.font_size, hover_color))
+    
     def set_parameter_buttons_state(self, enabled):
         """Enable or disable the Apply Parameters and Change Condition buttons."""
         try:
-            # Define disabled and enabled colors
-            disabled_bg = "#f5f5f5"  # Light gray
-            disabled_fg = "#9e9e9e"  # Gray text
-            enabled_bg = "#e8f5e8"   # Light green
-            enabled_fg = "#28a745"   # Green text
+            # Disabled colours come from the 'disabled' state of the neumorphic style
+            state = "normal" if enabled else "disabled"
+            self.send_limits_button.configure(state=state)
+            self.change_condition_button.configure(state=state)
             
             if enabled:
-                # Enable Apply Parameters button
-                self.send_limits_button.configure(
-                    state="normal",
-                    bg=enabled_bg,
-                    fg=enabled_fg
-                )
-                self.send_limits_button.button_frame.configure(bg=enabled_bg)
-                
-                # Enable Change Condition button
-                self.change_condition_button.configure(
-                    state="normal",
-                    bg=enabled_bg,
-                    fg=enabled_fg
-                )
-                self.change_condition_button.button_frame.configure(bg=enabled_bg)
-                
                 self.logger.info("Apply Parameters and Change Condition buttons enabled")
             else:
-                # Disable Apply Parameters button
-                self.send_limits_button.configure(
-                    state="disabled",
-                    bg=disabled_bg,
-                    fg=disabled_fg
-                )
-                self.send_limits_button.button_frame.configure(bg=disabled_bg)
-                
-                # Disable Change Condition button
-                self.change_condition_button.configure(
-                    state="disabled",
-                    bg=disabled_bg,
-                    fg=disabled_fg
-                )
-                self.change_condition_button.button_frame.configure(bg=disabled_bg)
-                
                 self.logger.info("Apply Parameters and Change Condition buttons disabled")
                 
         except Exception as e:
             self.logger.error(f"Error setting parameter button states: {str(e)}")
        
+    def _set_start_button_active(self, active):
+        """Switch the start button between its active and inactive states in one place."""
+        if active:
+            # Light green background, green text, slightly darker light green on hover
+            self.set_neumorphic_colors(self.Start_GUI_button, "#d4f6d4", "#28a745", "#c3f0c3")
+            self.Start_GUI_button.configure(text="Active")
+        else:
+            self.set_neumorphic_colors(self.Start_GUI_button, "#e0e5ec", "#333333")  # Default dark text
+            self.Start_GUI_button.configure(text="Start")
+        self.start_button_active = active
+        
+        # Parameter buttons are only usable while the start button is active
+        self.set_parameter_buttons_state(active)
+
     def toggle_start_button(self):
         """Toggle neumorphic start button between inactive and active states."""
         try:
@@ -362,29 +391,7 @@ class FlashSinterGUI:
                 
                 if hasattr(self, 'data_filepath') and self.data_filepath:
                     # File was selected, proceed with activation
-                    # Change to active neumorphic state (light green background)
-                    active_color = "#d4f6d4"  # Light green background
-                    self.Start_GUI_button.configure(bg=active_color, fg="#28a745")  # Green text
-                    self.Start_GUI_button.button_frame.configure(bg=active_color)
-                    self.Start_GUI_button.configure(text="Active")
-                   
-                    # Update hover effects for active state
-                    def on_enter_active(e):
-                        self.Start_GUI_button.configure(bg="#c3f0c3")  # Slightly darker light green on hover
-                        self.Start_GUI_button.button_frame.configure(bg="#c3f0c3")
-                    def on_leave_active(e):
-                        self.Start_GUI_button.configure(bg=active_color)
-                        self.Start_GUI_button.button_frame.configure(bg=active_color)
-                   
-                    # Remove old bindings and add new ones
-                    self.Start_GUI_button.unbind("<Enter>")
-                    self.Start_GUI_button.unbind("<Leave>")
-                    self.Start_GUI_button.bind("<Enter>", on_enter_active)
-                    self.Start_GUI_button.bind("<Leave>", on_leave_active)
-                   
-                    self.start_button_active = True
-                    # Enable parameter buttons when start button is activated
-                    self.set_parameter_buttons_state(True)
+                    self._set_start_button_active(True)
                     self.logger.info("Neumorphic start button activated")
                     self.logger.info(f"Data will be saved to: {self.data_filepath}")
                 else:
@@ -393,28 +400,7 @@ class FlashSinterGUI:
                     return
             else:
                 # Already active: change back to inactive state
-                inactive_color = "#e0e5ec"
-                self.Start_GUI_button.configure(bg=inactive_color, fg="#333333")  # Default dark text
-                self.Start_GUI_button.button_frame.configure(bg=inactive_color)
-                self.Start_GUI_button.configure(text="Start")
-               
-                # Update hover effects for inactive state
-                def on_enter_inactive(e):
-                    self.Start_GUI_button.configure(bg="#d1d9e6")
-                    self.Start_GUI_button.button_frame.configure(bg="#d1d9e6")
-                def on_leave_inactive(e):
-                    self.Start_GUI_button.configure(bg=inactive_color)
-                    self.Start_GUI_button.button_frame.configure(bg=inactive_color)
-               
-                # Remove old bindings and add new ones
-                self.Start_GUI_button.unbind("<Enter>")
-                self.Start_GUI_button.unbind("<Leave>")
-                self.Start_GUI_button.bind("<Enter>", on_enter_inactive)
-                self.Start_GUI_button.bind("<Leave>", on_leave_inactive)
-               
-                self.start_button_active = False
-                # Disable parameter buttons when start button is deactivated
-                self.set_parameter_buttons_state(False)
+                self._set_start_button_active(False)
                 self.logger.info("Neumorphic start button deactivated")
            
             # Execute the original start functionality
@@ -454,16 +440,16 @@ class FlashSinterGUI:
 
     def read_entries(self):
         try:
-            elec_d = float(self.Elec_D_entry.get())
-            width = float(self.width_entry.get())
-            thickness = float(self.Thickness_entry.get())
-            e_field = float(self.E_Field_entry.get())
-            curr_dens = float(self.Curr_Dens_entry.get())
-            hold_time = float(self.Hold_Time_entry.get())  # NEW: Read Hold Time
+            params = {key: var.get() for key, var in self._params.items()}
+            elec_d = params["length"]
+            width = params["width"]
+            thickness = params["thickness"]
+            e_field = params["e_field"]
+            curr_dens = params["curr_dens"]
+            hold_time = params["hold_time"]  # NEW: Read Hold Time
            
             # Calculate voltage and current
-            voltage = e_field * elec_d
-            current = curr_dens * width * thickness
+            voltage, current = compute_setpoints(elec_d, width, thickness, e_field, curr_dens)
            
             # Update voltage and current entries
             self.voltage_entry.delete(0, END)
@@ -484,10 +470,14 @@ class FlashSinterGUI:
             self.hold_time = hold_time
             # Update controller's hold time
             self.controller.update_hold_time(hold_time)
+            
+            # Refresh the acquisition worker's snapshots so edits apply to a running experiment
+            self._hold_time = hold_time
+            self._current_limit = current
            
             self.logger.info(f"Updated parameters: {elec_d}, {width}, {thickness}, {e_field}, {curr_dens}, Hold Time: {hold_time}s")
             self.logger.info(f"Calculated voltage: {voltage:.2f}V, current: {current:.2f}mA")
-        except ValueError as e:
+        except (TclError, ValueError) as e:
             self.logger.error(f"Invalid input: {str(e)}")
 
     def load_usb_camera(self):
@@ -507,17 +497,19 @@ class FlashSinterGUI:
             # Log actual camera settings
             self.logger.info(f"Camera properties: FPS={actual_fps}, Resolution={int(actual_width)}x{int(actual_height)}")
            
+            # Cache the properties for recording; many USB cameras report 0 FPS, which makes a broken AVI
+            self._cap_w = int(actual_width)
+            self._cap_h = int(actual_height)
+            self._cap_fps = actual_fps if actual_fps > 0 else 30.0
+           
             frame = self.image_acquisition_frame
             self.is_recording = False
             self.video_writer = None
 
             def update_frame():
-                ret, img_frame = self.cap.read()
-                if ret:
-                    # Save frame if recording
-                    if self.is_recording and self.video_writer is not None:
-                        self.video_writer.write(img_frame)
-                   
+                # Take the newest frame published by the capture thread, if any
+                img_frame, self._latest_frame = self._latest_frame, None
+                if img_frame is not None:
                     img_frame = cv2.cvtColor(img_frame, cv2.COLOR_BGR2RGB)
                     img_frame = cv2.convertScaleAbs(img_frame, alpha=1.2, beta=10)
                     img = Image.fromarray(img_frame)
@@ -546,26 +538,92 @@ class FlashSinterGUI:
                     self.camera_label.imgtk = imgtk
                     self.camera_label.configure(image=imgtk)
                
-                self.camera_label.after(33, update_frame)
+                self._schedule('camera', 33, update_frame)
 
             # Place camera label to fill entire video display frame - covers black background
             self.camera_label = Label(self.video_display_frame, bg="#000000")
             self.camera_label.place(x=0, y=0, width=self.image_acquisition_frame_W - 20,
                                    height=self.image_acquisition_frame_H - 60)  # Fill entire video area
+           
+            # Frames are grabbed on a capture thread; the Tk loop only displays the latest one
+            self._latest_frame = None
+            self._capture_stop = threading.Event()
+            self._capture_thread = threading.Thread(target=self._capture_loop, name="camera-capture", daemon=True)
+            self._capture_thread.start()
             update_frame()
             self.logger.info(f"Camera initialized successfully with FPS: {actual_fps}, Resolution: {actual_width}x{actual_height}")
         except Exception as e:
             self.logger.error(f"Failed to initialize camera: {str(e)}")
            
+    def _capture_loop(self):
+        """Capture thread: grab every frame, decode only those that are displayed or recorded."""
+        cap = self.cap
+        ui_period = 0.033  # Match the 33 ms display refresh
+        last_ui = 0.0
+        while not self._capture_stop.is_set():
+            if not cap.grab():
+                self._capture_stop.wait(0.01)
+                continue
+            now = time.perf_counter()
+            show = now - last_ui >= ui_period
+            if not (show or self.is_recording):
+                continue
+            ret, frame = cap.retrieve()
+            if not ret:
+                continue
+            if self.is_recording:
+                try:
+                    self._encode_q.put_nowait(frame)
+                except queue.Full:
+                    self._dropped_frames += 1  # Encoder is behind; drop this frame rather than block
+            if show:
+                self._latest_frame = frame
+                last_ui = now
+
+    def _stop_capture_thread(self):
+        """Stop the capture thread; True once it has exited and the camera can be released."""
+        if hasattr(self, '_capture_thread') and self._capture_thread is not None:
+            self._capture_stop.set()
+            self._capture_thread.join(timeout=1.0)
+            if self._capture_thread.is_alive():
+                self.logger.error("Capture thread is still inside grab(); not releasing the camera")
+                return False
+            self._capture_thread = None
+        return True
+
+    def _release_capture(self):
+        """Stop the capture thread and release the camera if the thread has let go of it."""
+        if self._stop_capture_thread():
+            self.cap.release()
+        # Otherwise the stuck thread still holds its own reference; the capture is released
+        # when that thread exits and the object is collected
+        self.cap = None
+
+    def _encode_loop(self, writer, frames):
+        """Encoder thread: write queued frames until the None sentinel arrives, then release the writer."""
+        # The writer is released here, so it is never closed while a frame is being written
+        try:
+            while True:
+                frame = frames.get()
+                if frame is None:
+                    break
+                writer.write(frame)
+        finally:
+            writer.release()
+
     def stop_usb_camera(self):
         try:
             # Stop recording if active
             if self.is_recording:
                 self.stop_recording()
+            
+            # Stop the frame update loop and capture thread before releasing the capture
+            self._cancel('camera')
            
             if hasattr(self, 'cap') and self.cap is not None:
-                self.cap.release()
-                self.cap = None
+                self._release_capture()
+            else:
+                self._stop_capture_thread()
             if hasattr(self, 'camera_label') and self.camera_label:
                 self.camera_label.config(image='')
                 self.camera_label.destroy()  # Properly remove the label
@@ -583,28 +641,9 @@ class FlashSinterGUI:
                
                 # Update to unload state (red neumorphic)
                 self.is_camera_loaded = True
-                red_color = "#ffe8e8"  # Light red background
-                self.camera_toggle_button.configure(
-                    text="Unloading",
-                    bg=red_color,
-                    fg="#dc2626"  # Red text
-                )
-                self.camera_toggle_button.button_frame.configure(bg=red_color)
-                
-                # Update hover effects for red state
-                def on_enter_red(e):
-                    hover_red = "#ffd6d6"
-                    self.camera_toggle_button.configure(bg=hover_red)
-                    self.camera_toggle_button.button_frame.configure(bg=hover_red)
-                def on_leave_red(e):
-                    self.camera_toggle_button.configure(bg=red_color)
-                    self.camera_toggle_button.button_frame.configure(bg=red_color)
-                
-                # Remove old bindings and add new ones
-                self.camera_toggle_button.unbind("<Enter>")
-                self.camera_toggle_button.unbind("<Leave>")
-                self.camera_toggle_button.bind("<Enter>", on_enter_red)
-                self.camera_toggle_button.bind("<Leave>", on_leave_red)
+                self.camera_toggle_button.configure(text="Unloading")
+                # Light red background, red text, darker red on hover
+                self.set_neumorphic_colors(self.camera_toggle_button, "#ffe8e8", "#dc2626", "#ffd6d6")
                 
                 self.logger.info("Camera loaded successfully - button changed to red")
                
@@ -614,55 +653,17 @@ class FlashSinterGUI:
                
                 # Update to load state (green neumorphic)
                 self.is_camera_loaded = False
-                green_color = "#e8f5e8"  # Light green background
-                self.camera_toggle_button.configure(
-                    text="Loading",
-                    bg=green_color,
-                    fg="#28a745"  # Green text
-                )
-                self.camera_toggle_button.button_frame.configure(bg=green_color)
-                
-                # Update hover effects for green state
-                def on_enter_green(e):
-                    hover_green = "#d4f6d4"
-                    self.camera_toggle_button.configure(bg=hover_green)
-                    self.camera_toggle_button.button_frame.configure(bg=hover_green)
-                def on_leave_green(e):
-                    self.camera_toggle_button.configure(bg=green_color)
-                    self.camera_toggle_button.button_frame.configure(bg=green_color)
-                
-                # Remove old bindings and add new ones
-                self.camera_toggle_button.unbind("<Enter>")
-                self.camera_toggle_button.unbind("<Leave>")
-                self.camera_toggle_button.bind("<Enter>", on_enter_green)
-                self.camera_toggle_button.bind("<Leave>", on_leave_green)
+                self.camera_toggle_button.configure(text="Loading")
+                # Light green background, green text, darker green on hover
+                self.set_neumorphic_colors(self.camera_toggle_button, "#e8f5e8", "#28a745", "#d4f6d4")
                 
                 self.logger.info("Camera stopped successfully - button changed to green")
                
         except Exception as e:
             # Reset to green loading state on error (neumorphic)
             self.is_camera_loaded = False
-            green_color = "#e8f5e8"  # Light green background
-            self.camera_toggle_button.configure(
-                text="Loading",
-                bg=green_color,
-                fg="#28a745"  # Green text
-            )
-            self.camera_toggle_button.button_frame.configure(bg=green_color)
-            
-            # Reset hover effects for green state
-            def on_enter_green(e):
-                hover_green = "#d4f6d4"
-                self.camera_toggle_button.configure(bg=hover_green)
-                self.camera_toggle_button.button_frame.configure(bg=hover_green)
-            def on_leave_green(e):
-                self.camera_toggle_button.configure(bg=green_color)
-                self.camera_toggle_button.button_frame.configure(bg=green_color)
-            
-            self.camera_toggle_button.unbind("<Enter>")
-            self.camera_toggle_button.unbind("<Leave>")
-            self.camera_toggle_button.bind("<Enter>", on_enter_green)
-            self.camera_toggle_button.bind("<Leave>", on_leave_green)
+            self.camera_toggle_button.configure(text="Loading")
+            self.set_neumorphic_colors(self.camera_toggle_button, "#e8f5e8", "#28a745", "#d4f6d4")
             
             self.logger.error(f"Error toggling camera: {str(e)}")
            
@@ -691,8 +692,10 @@ class FlashSinterGUI:
             self.voltage_current_plot_frame_H - 50  # Reduce height to accommodate buttons
         )
        
-        # Create matplotlib figure for voltage-current plot (more square format)
-        self.fig, self.ax = plt.subplots(figsize=(6, 5))
+        # Create matplotlib figure for voltage-current plot (more square format).
+        # Embedded figures are built without pyplot so no global figure manager tracks them
+        self.fig = Figure(figsize=(6, 5))
+        self.ax = self.fig.add_subplot()
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.voltage_current_plot_frame)
         self.canvas.get_tk_widget().pack(fill=BOTH, expand=True)
        
@@ -715,9 +718,22 @@ class FlashSinterGUI:
         # Initialize plot with professional formatting
         self.setup_professional_plot()
         
-        # Initialize empty line objects for smooth updates
-        self.line_voltage, = self.ax.plot([], [], 'b-', label='Voltage (V)', linewidth=0.5, antialiased=True)
-        self.line_current, = self.ax2.plot([], [], 'r-', label='Current (mA)', linewidth=0.5, antialiased=True)
+        # Initialize empty line objects for smooth updates (animated: blitted over the cached background)
+        self.line_voltage, = self.ax.plot([], [], 'b-', label='Voltage (V)', linewidth=0.5,
+                                          antialiased=PLOTTING_CONFIG["use_antialiasing"],
+                                          solid_joinstyle='bevel', solid_capstyle='butt',
+                                          animated=True)
+        self.line_current, = self.ax2.plot([], [], 'r-', label='Current (mA)', linewidth=0.5,
+                                           antialiased=PLOTTING_CONFIG["use_antialiasing"],
+                                           solid_joinstyle='bevel', solid_capstyle='butt',
+                                           animated=True)
+        self._plot_bg = None
+        self._last_full_draw = 0.0
+        self.canvas.mpl_connect('draw_event', self._on_plot_draw)
+        
+        # Track the plot width in pixels to bound the number of plotted points
+        self._canvas_px = self.voltage_current_plot_frame_W
+        self.canvas.get_tk_widget().bind('<Configure>', self._on_plot_resize, add='+')
        
         # Constraint frame header and components
         self.constraint_label = self.create_label(self.constraint_frame, self.constraint_frame_Left,
@@ -728,6 +744,16 @@ class FlashSinterGUI:
         compressed_sub_W = round((self.constraint_frame_W - 120) / 6)  # Reduced spacing for 6 boxes
         spacing_between_boxes = 8  # Reduced spacing between boxes
         
+        # Sample parameters are bound to Tk variables, which hold the defaults and parse floats
+        self._params = {
+            "length": DoubleVar(self.root, value=0.4),       # cm
+            "width": DoubleVar(self.root, value=1.6),        # mm
+            "thickness": DoubleVar(self.root, value=1.0),    # mm
+            "e_field": DoubleVar(self.root, value=30.0),     # V/cm
+            "curr_dens": DoubleVar(self.root, value=100.0),  # mA/mm^2
+            "hold_time": DoubleVar(self.root, value=60.0),   # s
+        }
+        
         # Create all the entry fields and labels for constraints (compressed layout)
         self.Elec_D_label = self.create_label(self.constraint_frame, self.constraint_frame_Left,
                                             self.constraint_frame_sub_H+20, "Length\n(cm)",
@@ -735,8 +761,8 @@ class FlashSinterGUI:
                                             compressed_sub_W, "center")
         self.Elec_D_entry = self.create_entry(self.constraint_frame, self.constraint_frame_Left,
                                             self.constraint_frame_H-self.constraint_frame_Top-self.constraint_frame_sub_H,
-                                            compressed_sub_W, self.constraint_frame_sub_H)
-        self.Elec_D_entry.insert(0, "0.4")  # Default value
+                                            compressed_sub_W, self.constraint_frame_sub_H,
+                                            textvariable=self._params["length"])
        
         self.width_label = self.create_label(self.constraint_frame,
                                            self.constraint_frame_Left+compressed_sub_W+spacing_between_boxes,
@@ -746,8 +772,8 @@ class FlashSinterGUI:
         self.width_entry = self.create_entry(self.constraint_frame,
                                            self.constraint_frame_Left+compressed_sub_W+spacing_between_boxes,
                                            self.constraint_frame_H-self.constraint_frame_Top-self.constraint_frame_sub_H,
-                                           compressed_sub_W, self.constraint_frame_sub_H)
-        self.width_entry.insert(0, "1.6")  # Default value
+                                           compressed_sub_W, self.constraint_frame_sub_H,
+                                           textvariable=self._params["width"])
        
         self.Thickness_label = self.create_label(self.constraint_frame,
                                                self.constraint_frame_Left+2*compressed_sub_W+2*spacing_between_boxes,
@@ -757,8 +783,8 @@ class FlashSinterGUI:
         self.Thickness_entry = self.create_entry(self.constraint_frame,
                                                self.constraint_frame_Left+2*compressed_sub_W+2*spacing_between_boxes,
                                                self.constraint_frame_H-self.constraint_frame_Top-self.constraint_frame_sub_H,
-                                               compressed_sub_W, self.constraint_frame_sub_H)
-        self.Thickness_entry.insert(0, "1.0")  # Default value
+                                               compressed_sub_W, self.constraint_frame_sub_H,
+                                               textvariable=self._params["thickness"])
        
         self.E_Field_label = self.create_label(self.constraint_frame,
                                              self.constraint_frame_Left+3*compressed_sub_W+3*spacing_between_boxes,
@@ -768,8 +794,8 @@ class FlashSinterGUI:
         self.E_Field_entry = self.create_entry(self.constraint_frame,
                                              self.constraint_frame_Left+3*compressed_sub_W+3*spacing_between_boxes,
                                              self.constraint_frame_H-self.constraint_frame_Top-self.constraint_frame_sub_H,
-                                             compressed_sub_W, self.constraint_frame_sub_H)
-        self.E_Field_entry.insert(0, "30.0")  # Default value
+                                             compressed_sub_W, self.constraint_frame_sub_H,
+                                             textvariable=self._params["e_field"])
        
         self.Curr_Dens_label = self.create_label(self.constraint_frame,
                                                self.constraint_frame_Left+4*compressed_sub_W+4*spacing_between_boxes,
@@ -779,8 +805,8 @@ class FlashSinterGUI:
         self.Curr_Dens_entry = self.create_entry(self.constraint_frame,
                                                self.constraint_frame_Left+4*compressed_sub_W+4*spacing_between_boxes,
                                                self.constraint_frame_H-self.constraint_frame_Top-self.constraint_frame_sub_H,
-                                               compressed_sub_W, self.constraint_frame_sub_H)
-        self.Curr_Dens_entry.insert(0, "100.0")  # Default value
+                                               compressed_sub_W, self.constraint_frame_sub_H,
+                                               textvariable=self._params["curr_dens"])
         
         # NEW: Hold Time input box
         self.Hold_Time_label = self.create_label(self.constraint_frame,
@@ -791,8 +817,8 @@ class FlashSinterGUI:
         self.Hold_Time_entry = self.create_entry(self.constraint_frame,
                                                 self.constraint_frame_Left+5*compressed_sub_W+5*spacing_between_boxes,
                                                 self.constraint_frame_H-self.constraint_frame_Top-self.constraint_frame_sub_H,
-                                                compressed_sub_W, self.constraint_frame_sub_H)
-        self.Hold_Time_entry.insert(0, "60.0")  # Default value
+                                                compressed_sub_W, self.constraint_frame_sub_H,
+                                                textvariable=self._params["hold_time"])
        
         # Apply Parameters button (positioned at the far right side of the frame)
         button_width = 140  # Increased width to fit "Apply Parameters" text properly
@@ -1001,8 +1027,41 @@ class FlashSinterGUI:
                                                    self.merged_right_panel_H,
                                                    bg_color="#ffffff", border_color="#b3d9ff", border_width=2)
        
+        # The induction figure is built on first use (see _ensure_induction_plot)
+        self._induction_built = False
+        self.induction_placeholder = Label(self.merged_right_panel,
+                                           text="Induction vs Time\n\nWaiting for magnetics data - click to show plot",
+                                           font=("Segoe UI", 11), bg="#ffffff", fg="#7f8c8d", cursor="hand2")
+        self.induction_placeholder.pack(fill=BOTH, expand=True)
+        self.induction_placeholder.bind("<Button-1>", lambda e: self._ensure_induction_plot())
+       
+        # Initialize data storage for induction plotting
+        self.induction_time = deque(maxlen=PLOTTING_CONFIG["max_data_points"])
+        self.induction_data = deque(maxlen=PLOTTING_CONFIG["max_data_points"])
+        self._induction_q = queue.Queue()  # (time, induction) samples from acquisition threads
+        self._induction_bg = None
+        
+        # Static high-quality snapshot of the induction plot
+        self.render_hq_button = self.create_neumorphic_button(
+            self.merged_right_panel, self.merged_right_panel_W - 170, 8,
+            "Render High-Quality", 155, 28, bg_color="#e8f0ff", fg_color="#2759cd",
+            font_size=9, command=self.render_induction_high_quality
+        )
+        
+        # Initially disable Apply Parameters and Change Condition buttons
+        self.set_parameter_buttons_state(False)
+       
+    def _ensure_induction_plot(self):
+        """Build the induction figure and canvas the first time they are needed."""
+        if self._induction_built:
+            return
+        self._induction_built = True
+        self.induction_placeholder.destroy()
+        self._start_induction_pump()
+        
         # Create matplotlib figure for induction vs time plot
-        self.induction_fig, self.induction_ax = plt.subplots(figsize=(8, 4))
+        self.induction_fig = Figure(figsize=(8, 4))
+        self.induction_ax = self.induction_fig.add_subplot()
         self.induction_canvas = FigureCanvasTkAgg(self.induction_fig, master=self.merged_right_panel)
         self.induction_canvas.get_tk_widget().pack(fill=BOTH, expand=True)
        
@@ -1010,33 +1069,118 @@ class FlashSinterGUI:
         self.induction_ax.set_xlabel('Time (s)')
         self.induction_ax.set_ylabel('Induction (mT)')
        
-        # Enhanced grid configuration for induction plot
+        # Live plot keeps only the major grid; minor ticks are re-laid-out on every draw.
+        # Full styling is available on demand via render_induction_high_quality()
         self.induction_ax.grid(True, which='major', color='#d5d5d5', linestyle='-', linewidth=0.8, alpha=0.7)
-        self.induction_ax.grid(True, which='minor', color='#e8e8e8', linestyle=':', linewidth=0.5, alpha=0.5)
-        self.induction_ax.minorticks_on()  # Enable minor ticks for finer grid
-       
-        # Configure tick parameters for closer spacing
         self.induction_ax.tick_params(which='major', length=6, width=1.2, color='#666666')
-        self.induction_ax.tick_params(which='minor', length=3, width=0.8, color='#999999')
        
-        # Set custom tick locators for finer control
-        from matplotlib.ticker import AutoMinorLocator
-        self.induction_ax.xaxis.set_minor_locator(AutoMinorLocator(5))  # 5 minor ticks between major ticks
-        self.induction_ax.yaxis.set_minor_locator(AutoMinorLocator(5))  # 5 minor ticks between major ticks
-       
-        # Initialize empty plot line
-        self.line_induction, = self.induction_ax.plot([], [], 'g-', linewidth=0.5)
+        # Initialize empty plot line (animated: drawn by blitting on top of the cached background)
+        self.line_induction, = self.induction_ax.plot([], [], 'g-', linewidth=0.5,
+                                                      antialiased=PLOTTING_CONFIG["use_antialiasing"],
+                                                      solid_joinstyle='bevel', solid_capstyle='butt',
+                                                      animated=True)
        
         # Set default axis limits
         self.induction_ax.set_xlim(0, 1)
         self.induction_ax.set_ylim(0, 1)
        
-        # Initialize data storage for induction plotting
-        self.induction_data = []
+        self.induction_canvas.mpl_connect('draw_event', self._on_induction_draw)
         
-        # Initially disable Apply Parameters and Change Condition buttons
-        self.set_parameter_buttons_state(False)
-       
+        # Keep the snapshot button above the newly packed canvas
+        self.render_hq_button.lift()
+        
+        self.induction_canvas.draw()
+        self.logger.info("Induction plot initialized")
+
+    def push_induction_sample(self, t, induction):
+        """Queue an induction sample for plotting. Safe to call from any thread."""
+        self._induction_q.put((t, induction))
+        self._start_induction_pump()
+
+    def _start_induction_pump(self):
+        """Start draining induction samples on the Tk thread, if not already running."""
+        # Not started in __init__: until a producer pushes samples or the plot is opened
+        # there is nothing to drain, and the timer would only wake the Tk loop 30 times a second
+        if 'induction' not in self._after_tokens:
+            self._schedule('induction', 33, self._pump_induction)
+
+    def _on_induction_draw(self, event):
+        """Cache the induction axes background after every full redraw."""
+        self._induction_bg = self.induction_canvas.copy_from_bbox(self.induction_ax.bbox)
+        self.induction_ax.draw_artist(self.line_induction)
+
+    def _pump_induction(self):
+        """Drain queued induction samples and blit the updated line."""
+        try:
+            new_samples = False
+            while True:
+                try:
+                    t, induction = self._induction_q.get_nowait()
+                except queue.Empty:
+                    break
+                self.induction_time.append(t)
+                self.induction_data.append(induction)
+                new_samples = True
+            
+            if new_samples:
+                self._ensure_induction_plot()
+                time_values = np.fromiter(self.induction_time, dtype=float, count=len(self.induction_time))
+                induction_values = np.fromiter(self.induction_data, dtype=float, count=len(self.induction_data))
+                self.line_induction.set_data(time_values, induction_values)
+                
+                # Rescale (full redraw) only when the data leaves the current view
+                x_min, x_max = self.induction_ax.get_xlim()
+                y_min, y_max = self.induction_ax.get_ylim()
+                b_min, b_max = induction_values.min(), induction_values.max()
+                if time_values[-1] > x_max or b_min < y_min or b_max > y_max:
+                    padding = max((b_max - b_min) * 0.1, 0.1)
+                    self.induction_ax.set_xlim(0, time_values[-1] * 1.1)
+                    self.induction_ax.set_ylim(b_min - padding, b_max + padding)
+                    self.induction_canvas.draw_idle()
+                elif self._induction_bg is not None:
+                    self.induction_canvas.restore_region(self._induction_bg)
+                    self.induction_ax.draw_artist(self.line_induction)
+                    self.induction_canvas.blit(self.induction_ax.bbox)
+        except Exception as e:
+            self.logger.error(f"Error updating induction plot: {e}")
+        finally:
+            self._schedule('induction', 33, self._pump_induction)
+
+    def render_induction_high_quality(self):
+        """Open a separate window with a fully styled snapshot of the induction plot."""
+        try:
+            time_values = list(self.induction_time)
+            induction_values = list(self.induction_data)
+            
+            window = Toplevel(self.root)
+            window.title("Induction vs Time - High Quality")
+            
+            fig = Figure(figsize=(8, 4))
+            ax = fig.add_subplot()
+            ax.plot(time_values, induction_values, 'g-', linewidth=1.0, antialiased=True)
+            ax.set_xlabel('Time (s)')
+            ax.set_ylabel('Induction (mT)')
+            
+            # Enhanced grid configuration with minor ticks
+            ax.grid(True, which='major', color='#d5d5d5', linestyle='-', linewidth=0.8, alpha=0.7)
+            ax.grid(True, which='minor', color='#e8e8e8', linestyle=':', linewidth=0.5, alpha=0.5)
+            ax.minorticks_on()
+            ax.tick_params(which='major', length=6, width=1.2, color='#666666')
+            ax.tick_params(which='minor', length=3, width=0.8, color='#999999')
+            
+            from matplotlib.ticker import AutoMinorLocator
+            ax.xaxis.set_minor_locator(AutoMinorLocator(5))
+            ax.yaxis.set_minor_locator(AutoMinorLocator(5))
+            fig.tight_layout()
+            
+            canvas = FigureCanvasTkAgg(fig, master=window)
+            canvas.get_tk_widget().pack(fill=BOTH, expand=True)
+            canvas.draw()
+            
+            self.logger.info("Rendered high-quality induction plot")
+        except Exception as e:
+            self.logger.error(f"Error rendering high-quality induction plot: {e}")
+
     def setup_serial(self):
         """Initialize serial connection to Arduino."""
         try:
@@ -1048,6 +1192,7 @@ class FlashSinterGUI:
                 
             self.arduino = serial.Serial(port=selected_port, baudrate=9600, timeout=1)
             time.sleep(2)  # wait for Arduino to initialize
+            self._last_rpm_sent = None  # Fresh connection has no RPM set yet
             self.logger.info(f"Serial connection established with Arduino on {selected_port}")
         except serial.SerialException as e:
             self.arduino = None
@@ -1072,9 +1217,13 @@ class FlashSinterGUI:
 
     def send_command(self, cmd):
         """Send command to Arduino."""
+        return self.send_bytes((cmd + '\n').encode('ascii'))
+
+    def send_bytes(self, payload):
+        """Send a newline-terminated, pre-encoded command to Arduino."""
         if self.arduino:
             try:
-                self.arduino.write((cmd + '\n').encode())
+                self.arduino.write(payload)
                 response = self.arduino.readline().decode().strip()
                 self.logger.info(f"Arduino response: {response}")
                 return response
@@ -1091,22 +1240,18 @@ class FlashSinterGUI:
             if self.is_forward_direction:
                 # Currently loading, change to unloading
                 self.is_forward_direction = False
-                self.stage_direction_button.configure(
-                    text="Unloading",
-                    bg="#dc2626",  # Using red for unloading
-                    activebackground="#b91c1c"
-                )
-                self.send_command("REV")  # Send reverse command to Arduino
+                self.stage_direction_button.configure(text="Unloading")
+                # Using red for unloading
+                self.set_neumorphic_colors(self.stage_direction_button, "#dc2626", "#ffffff", "#b91c1c")
+                self.send_bytes(self._CMD_REV)  # Send reverse command to Arduino
                 self.logger.info("Sliding stage direction set to unloading")
             else:
                 # Currently unloading, change to loading
                 self.is_forward_direction = True
-                self.stage_direction_button.configure(
-                    text="Loading",
-                    bg="#8b5cf6",  # Using purple for loading
-                    activebackground="#7c3aed"
-                )
-                self.send_command("FWD")  # Send forward command to Arduino
+                self.stage_direction_button.configure(text="Loading")
+                # Using purple for loading
+                self.set_neumorphic_colors(self.stage_direction_button, "#8b5cf6", "#ffffff", "#7c3aed")
+                self.send_bytes(self._CMD_FWD)  # Send forward command to Arduino
                 self.logger.info("Sliding stage direction set to loading")
                
         except Exception as e:
@@ -1118,12 +1263,11 @@ class FlashSinterGUI:
             if self.is_stage_running:
                 # Currently running, so stop it
                 self.is_stage_running = False
-                self.stage_start_button.configure(
-                    text="Start",
-                    bg="#304166",  # Using dark navy for start
-                    activebackground="#263552"
-                )
-                self.send_command("STOP")  # Send stop command to Arduino
+                self.stage_start_button.configure(text="Start")
+                # Using dark navy for start
+                self.set_neumorphic_colors(self.stage_start_button, "#304166", "#ffffff", "#263552")
+                self.send_bytes(self._CMD_STOP)  # Send stop command to Arduino
+                self._last_rpm_sent = None  # RPM:<n> is what restarts the motor, so resend it next start
                 self.logger.info("Sliding stage stopped")
             else:
                 # Currently stopped, so start it
@@ -1133,51 +1277,84 @@ class FlashSinterGUI:
                     if not self.arduino:
                         messagebox.showerror("Error", "No valid COM port connection available")
                         return
+
+                # Validate RPM before starting: RPM:<n> is what sets the motor going
+                try:
+                    rpm_val = float(self.stage_input1_entry.get())
+                except ValueError:
+                    rpm_val = None
+                if rpm_val is None or rpm_val < 0:
+                    self.logger.warning(f"Invalid RPM value: {self.stage_input1_entry.get()!r}")
+                    messagebox.showerror("Error", "RPM must be a non-negative number")
+                    return
                 
                 self.is_stage_running = True
-                self.stage_start_button.configure(
-                    text="Stop",
-                    bg="#ee4932",  # Using red for stop
-                    activebackground="#d9412c"
-                )
-                # Get RPM from entry and send it
-                rpm = self.stage_input1_entry.get()
-                if rpm.isdigit():
-                    self.send_command(f"RPM:{rpm}")
+                self.stage_start_button.configure(text="Stop")
+                # Using red for stop
+                self.set_neumorphic_colors(self.stage_start_button, "#ee4932", "#ffffff", "#d9412c")
+                # Send RPM only if it changed
+                if rpm_val != self._last_rpm_sent:
+                    self.send_bytes(f"RPM:{rpm_val:g}\n".encode('ascii'))
+                    self._last_rpm_sent = rpm_val
                 self.logger.info("Sliding stage started")
                
         except Exception as e:
             self.logger.error(f"Error toggling sliding stage: {e}")
 
+    def _schedule(self, key, ms, callback):
+        """Schedule a Tk after() callback, replacing any pending one with the same key."""
+        token = self._after_tokens.get(key)
+        if token:
+            self.root.after_cancel(token)
+        self._after_tokens[key] = self.root.after(ms, callback)
+
+    def _cancel(self, key):
+        """Cancel the pending after() callback registered under key, if any."""
+        token = self._after_tokens.pop(key, None)
+        if token:
+            self.root.after_cancel(token)
+
     def on_closing(self):
         """Clean up resources when closing the application."""
         try:
-            if self.arduino:
-                self.send_command("STOP")  # Stop motor before closing
-                self.arduino.close()
-            if hasattr(self, 'controller'):
-                self.controller.cleanup()
-            if hasattr(self, 'cap') and self.cap is not None:
-                self.cap.release()
+            # Cancel all pending timers so nothing fires into destroyed widgets
+            for key in list(self._after_tokens):
+                self._cancel(key)
+            self._exit_stack.close()
             self.root.destroy()
             self.logger.info("Application closed and resources cleaned up")
         except Exception as e:
             self.logger.error(f"Error during cleanup: {str(e)}")
             self.root.destroy()
 
+    def _close_serial(self):
+        """Stop the stage motor and close the Arduino port."""
+        if self.arduino:
+            self.send_bytes(self._CMD_STOP)  # Stop motor before closing
+            self._last_rpm_sent = None
+            self.arduino.close()
+            self.arduino = None
+
+    def _release_camera(self):
+        """Finish any recording and release the camera."""
+        if hasattr(self, 'video_writer') and self.video_writer is not None:
+            self.stop_recording()
+        if hasattr(self, 'cap') and self.cap is not None:
+            self._release_capture()
+
     def save_video(self):
         try:
             if hasattr(self, 'cap') and self.cap is not None:
                 # Create videos directory if it doesn't exist
                 videos_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'videos')
-                if not os.path.exists(videos_dir):
-                    os.makedirs(videos_dir)
+                os.makedirs(videos_dir, exist_ok=True)
                
                 # Get current timestamp for default filename
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 default_filename = f"video_{timestamp}.avi"
                
-                # Open file dialog to choose save location
+                # Open file dialog to choose save location. Tk dialogs must stay on the main
+                # thread; acquisition and camera capture keep running on their own threads
                 filename = filedialog.asksaveasfilename(
                     initialdir=videos_dir,
                     initialfile=default_filename,
@@ -1187,36 +1364,60 @@ class FlashSinterGUI:
                 )
                
                 if filename:  # If user didn't cancel the dialog
-                    # Get video properties
-                    width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-                    height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-                    fps = int(self.cap.get(cv2.CAP_PROP_FPS))
-                   
-                    # Create VideoWriter object
-                    fourcc = cv2.VideoWriter_fourcc(*'XVID')
-                    self.video_writer = cv2.VideoWriter(filename, fourcc, fps, (width, height))
-                   
-                    # Start recording
-                    self.is_recording = True
-                    self.logger.info(f"Started recording video to {filename}")
-                   
-                    # Update button state
-                    self.Save_video_button.configure(text="Stop Recording", bg="#DB4761",
-                                                   command=self.stop_recording)
+                    self._finish_save_video_setup(filename)
+        except Exception as e:
+            self.logger.error(f"Failed to start video recording: {str(e)}")
+
+    def _finish_save_video_setup(self, filename):
+        """Open the video writer and encoder thread for filename and start recording."""
+        try:
+            # Create VideoWriter object from the properties cached when the camera was opened
+            fourcc = cv2.VideoWriter_fourcc(*VIDEO_FOURCC)
+            self.video_writer = cv2.VideoWriter(filename, fourcc, self._cap_fps, (self._cap_w, self._cap_h))
+            if not self.video_writer.isOpened():
+                self.video_writer = None
+                raise RuntimeError(f"Could not open video writer for {filename}")
+           
+            # Encode on a background thread fed by a small queue; the capture
+            # thread drops frames instead of blocking if the encoder falls behind
+            self._encode_q = queue.Queue(maxsize=8)
+            self._dropped_frames = 0
+            self._encode_thread = threading.Thread(target=self._encode_loop,
+                                                   args=(self.video_writer, self._encode_q),
+                                                   name="video-encoder", daemon=True)
+            self._encode_thread.start()
+           
+            # Start recording
+            self.is_recording = True
+            self.logger.info(f"Started recording video to {filename}")
+           
+            # Update button state
+            self.Save_video_button.configure(text="Stop Recording", command=self.stop_recording)
+            self.set_neumorphic_colors(self.Save_video_button, "#DB4761", "#2759cd")
         except Exception as e:
             self.logger.error(f"Failed to start video recording: {str(e)}")
 
     def stop_recording(self):
         try:
             if hasattr(self, 'video_writer') and self.video_writer is not None:
-                self.video_writer.release()
-                self.video_writer = None
                 self.is_recording = False
+                if self._encode_thread.is_alive():
+                    try:
+                        # Encoder writes the queued frames, then exits and releases the writer
+                        self._encode_q.put(None, timeout=1.0)
+                    except queue.Full:
+                        self.logger.error("Video encoder is not draining its queue")
+                    self._encode_thread.join(timeout=5.0)
+                if self._encode_thread.is_alive():
+                    self.logger.warning("Video encoder still writing; the file is closed when it finishes")
+                self.video_writer = None
+                if self._dropped_frames:
+                    self.logger.warning(f"Dropped {self._dropped_frames} frames while the encoder was busy")
                 self.logger.info("Video recording stopped")
                
                 # Reset button state
-                self.Save_video_button.configure(text="Save Video", bg="#12BC95",
-                                               command=self.save_video)
+                self.Save_video_button.configure(text="Save Video", command=self.save_video)
+                self.set_neumorphic_colors(self.Save_video_button, "#12BC95", "#2759cd")
         except Exception as e:
             self.logger.error(f"Failed to stop video recording: {str(e)}")
 
@@ -1224,6 +1425,11 @@ class FlashSinterGUI:
         """Toggle data acquisition and plotting."""
         if not self.is_plotting:
             try:
+                # The previous run is still winding down (see _finish_stop_acquisition)
+                if 'acq_stop' in self._after_tokens:
+                    messagebox.showwarning("Busy", "The previous acquisition is still stopping. Please try again.")
+                    return
+                
                 # Check if a file has been selected (from Start button)
                 if not hasattr(self, 'data_filepath') or not self.data_filepath:
                     messagebox.showerror("Error", "Please click the Start button first to select a save file.")
@@ -1235,8 +1441,8 @@ class FlashSinterGUI:
                 
                 # Get hold time from entry (with default fallback)
                 try:
-                    hold_time = float(self.Hold_Time_entry.get())
-                except (ValueError, AttributeError):
+                    hold_time = self._params["hold_time"].get()
+                except (TclError, ValueError, AttributeError):
                     hold_time = 60.0  # Default fallback
                     self.logger.warning(f"Using default hold time: {hold_time}s")
                
@@ -1257,16 +1463,22 @@ class FlashSinterGUI:
                 self.logger.info(f"Started process with V={voltage_limit}V, I={current_limit}mA, Hold Time={hold_time}s")
                
                 # Initialize data storage and start time
-                self.voltage_data = []
-                self.current_data = []
-                self.time_data = []
+                self._reset_buffers()
                 self.start_time = time.time()
                
                 # Open the pre-selected file and write header
-                self.data_file = open(self.data_filepath, 'w')
+                self._row_buf = []
+                self.data_file = open(self.data_filepath, 'w', buffering=1 << 16)
+                if hasattr(os, 'posix_fadvise'):  # Not available on Windows/macOS
+                    # Written strictly front to back and never read back during the run
+                    os.posix_fadvise(self.data_file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
                 self.data_file.write("Time(s)\tVoltage(V)\tCurrent(mA)\n")
                 self.logger.info(f"Started saving data to {self.data_filepath}")
                
+                # Snapshot the limits the worker thread needs; Tk variables are main-thread only
+                self._hold_time = hold_time
+                self._current_limit = current_limit
+               
                 # Start data acquisition
                 self.is_plotting = True
                 self.start_plot_button.configure(text="Stop")
@@ -1312,17 +1524,24 @@ class FlashSinterGUI:
     def update_cv_cc_display(self):
         """Update the CV/CC mode display based on power supply status."""
         try:
-            if hasattr(self.controller.device_controller, 'get_power_supply_status'):
-                status = self.controller.device_controller.get_power_supply_status()
+            if self._get_power_supply_status is not None:
+                status = self._get_power_supply_status()
                 mode = status.get('mode', 'Unknown')
                 
+                # Log on a mode change, otherwise at most every 5 s
+                now = time.time()
+                if mode == self._last_mode and now - self._last_mode_log < 5.0:
+                    return
+                self._last_mode = mode
+                self._last_mode_log = now
+                
                 if mode == "CV":
                     self.logger.info("Power supply in CV Mode")
                 elif mode == "CC":
                     self.logger.info("Power supply in CC Mode")
                     # Log the transition for user awareness
                     if status.get('voltage_before_cc'):
-                        voltage_drop = status['voltage_before_cc'] - (self.voltage_data[-1] if self.voltage_data else 0)
+                        voltage_drop = status['voltage_before_cc'] - (self._v[self._last] if self._count else 0)
                         self.logger.info(f"CC Mode: Voltage dropped by {voltage_drop:.1f}V")
                 else:
                     self.logger.info("Power supply mode: Unknown")
@@ -1366,11 +1585,33 @@ class FlashSinterGUI:
         self.ax.set_xlim(0, 10)  # Will expand as needed
         self.ax.set_ylim(0, 100)
         self.ax2.set_ylim(0, 100)
+        self._last_xlim, self._last_ylim_v, self._last_ylim_c = (0, 10), (0, 100), (0, 100)
         
         # Enable interactive features
         self.ax.margins(x=0.01, y=0.05)
         self.ax2.margins(y=0.05)
         
+        # Timeline separator artists are created once and only repositioned in add_timeline_separator.
+        # Labels use data x and axes-fraction y so they stay put when the voltage limits change
+        sep_transform = self.ax.get_xaxis_transform()
+        self._sep_line = self.ax.axvline(x=0, color='gray', linestyle='--', alpha=0.5, linewidth=1, visible=False)
+        self._sep_lbl_r = self.ax.text(0, 0.95, 'Recent Data →', transform=sep_transform,
+                                       fontsize=8, color='gray', alpha=0.7, visible=False)
+        self._sep_lbl_l = self.ax.text(0, 0.95, '← Compressed', transform=sep_transform,
+                                       fontsize=8, color='gray', alpha=0.7, ha='right', visible=False)
+        
+        # Condition change markers come from a fixed pool reused round-robin, so rapid
+        # condition changes cannot pile up artists on the axes
+        self._cc_lines = [self.ax.axvline(x=0, color='orange', linestyle=':', alpha=0.8,
+                                          linewidth=2, visible=False)
+                          for _ in range(self.CC_MARKER_SLOTS)]
+        self._cc_texts = [self.ax.text(0, 0.85, '', transform=sep_transform,
+                                       fontsize=8, color='orange', fontweight='bold', visible=False,
+                                       bbox=dict(boxstyle="round,pad=0.3", facecolor='white',
+                                                 edgecolor='orange', alpha=0.8))
+                          for _ in range(self.CC_MARKER_SLOTS)]
+        self._cc_next = 0
+        
         # Add legend
         lines1, labels1 = self.ax.get_legend_handles_labels()
         lines2, labels2 = self.ax2.get_legend_handles_labels()
@@ -1379,6 +1620,30 @@ class FlashSinterGUI:
         # Tight layout for better appearance
         self.fig.tight_layout()
 
+    def _limits_changed(self, new, old, tolerance=0.02):
+        """Return True if either bound moved by more than tolerance relative to its old value."""
+        return any(abs(n - o) / max(abs(o), 1.0) > tolerance for n, o in zip(new, old))
+
+    def _on_plot_resize(self, event):
+        """Remember the plot canvas width after a resize."""
+        self._canvas_px = event.width
+
+    def _on_plot_draw(self, event):
+        """Cache the V/I figure background after every full redraw."""
+        self._plot_bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        self.ax.draw_artist(self.line_voltage)
+        self.ax2.draw_artist(self.line_current)
+
+    def _update_plot_blit(self):
+        """Repaint only the V/I lines over the cached background; False if a full draw is pending."""
+        if self._plot_bg is None:
+            return False
+        self.canvas.restore_region(self._plot_bg)
+        self.ax.draw_artist(self.line_voltage)
+        self.ax2.draw_artist(self.line_current)
+        self.canvas.blit(self.fig.bbox)
+        return True
+
     def compress_timeline_data(self, time_data, voltage_data, current_data, focus_window=None):
         """
         Compress timeline to show all data from 0 with recent data having higher resolution.
@@ -1408,227 +1673,337 @@ class FlashSinterGUI:
         # Split data into two parts: recent (high-res) and historical (compressed)
         recent_start_time = current_time - focus_window
         
-        # Find split index
-        split_idx = 0
-        for i, t in enumerate(time_data):
-            if t >= recent_start_time:
-                split_idx = i
-                break
+        # Find split index (first sample inside the focus window). Time is monotonic, so a
+        # binary search replaces the linear scan; the ring-buffer view is already float64,
+        # so asarray does not copy
+        time_data = np.asarray(time_data, dtype=np.float64)
+        split_idx = int(np.searchsorted(time_data, recent_start_time, side='left'))
         
-        # Recent data (last 30 seconds) - keep full resolution
-        recent_time = time_data[split_idx:]
-        recent_voltage = voltage_data[split_idx:]
-        recent_current = current_data[split_idx:]
+        # No historical data, just use recent data
+        if split_idx == 0:
+            return time_data, voltage_data, current_data
         
-        # Historical data - compress logarithmically
-        if split_idx > 0:
-            historical_time = time_data[:split_idx]
-            historical_voltage = voltage_data[:split_idx]
-            historical_current = current_data[:split_idx]
-            
-            # Compress historical data to fit in first 70% of plot width
-            compressed_historical_time = []
-            compressed_historical_voltage = []
-            compressed_historical_current = []
-            
-            # Use logarithmic compression for historical data
-            hist_duration = recent_start_time  # Duration of historical data
-            target_duration = focus_window * self.compression_ratio  # Compress based on config
-            
-            compression_factor = target_duration / hist_duration if hist_duration > 0 else 1
-            
-            for i, t in enumerate(historical_time):
-                # Apply logarithmic compression using configurable exponent
-                normalized_t = t / hist_duration  # 0 to 1
-                compressed_t = target_duration * (normalized_t ** self.compression_exponent)
-                
-                compressed_historical_time.append(compressed_t)
-                compressed_historical_voltage.append(historical_voltage[i])
-                compressed_historical_current.append(historical_current[i])
-            
-            # Shift recent data to start after compressed historical data
-            recent_offset = target_duration
-            shifted_recent_time = [t - recent_start_time + recent_offset for t in recent_time]
-            
-            # Combine compressed historical and shifted recent data
-            final_time = compressed_historical_time + shifted_recent_time
-            final_voltage = compressed_historical_voltage + recent_voltage
-            final_current = compressed_historical_current + recent_current
-            
-        else:
-            # No historical data, just use recent data
-            final_time = recent_time
-            final_voltage = recent_voltage  
-            final_current = recent_current
+        # Historical data is compressed logarithmically to fit in the first part of the plot
+        # width and recent data shifted after it. Only time is remapped: voltage and current
+        # keep their order, so they are passed through without copying
+        hist_duration = recent_start_time  # Duration of historical data
+        target_duration = focus_window * self.compression_ratio  # Compress based on config
+        final_time = compress_timeline(time_data, split_idx, hist_duration, target_duration,
+                                       self.compression_exponent)
         
-        return final_time, final_voltage, final_current
+        return final_time, voltage_data, current_data
 
     def smooth_data(self, data, window_size=5):
         """Apply moving average smoothing to data."""
         if len(data) < window_size:
             return data
         
-        smoothed = []
-        for i in range(len(data)):
-            start = max(0, i - window_size // 2)
-            end = min(len(data), i + window_size // 2 + 1)
-            smoothed.append(np.mean(data[start:end]))
-        return smoothed
+        # Running sum gives every window mean in one pass; the window shrinks
+        # at the edges exactly like the per-index slices it replaces
+        arr = np.asarray(data, dtype=np.float64)
+        n = len(arr)
+        half = window_size // 2
+        idx = np.arange(n)
+        start = np.maximum(idx - half, 0)
+        end = np.minimum(idx + half + 1, n)
+        csum = np.concatenate(([0.0], np.cumsum(arr)))
+        # Sum in float64 for accuracy, hand back float32 like the ring buffers
+        return ((csum[end] - csum[start]) / (end - start)).astype(np.float32)
 
     def start_data_acquisition(self):
-        """Start optimized data acquisition with smooth plotting."""
-        try:
-            # Check if experiment was stopped due to hold time
-            if hasattr(self.controller.device_controller, 'experiment_stopped_by_hold_time') and \
-               self.controller.device_controller.experiment_stopped_by_hold_time:
-                self.logger.info("Experiment automatically stopped due to hold time limit reached")
-                
-                # Check if video recording is active and stop it
-                video_was_recording = hasattr(self, 'is_recording') and self.is_recording
-                if video_was_recording:
-                    self.logger.info("Stopping video recording due to automatic experiment termination")
-                    self.stop_recording()
-                
-                # Stop GUI data acquisition (same as clicking stop button)
-                self.stop_data_acquisition()
-                
-                # Show notification to user with appropriate message
-                message = (f"Experiment automatically stopped after CV→CC transition hold time was reached.\n\n"
-                          f"Data has been saved to: {os.path.basename(self.data_filepath) if self.data_filepath else 'file'}")
-                
-                if video_was_recording:
-                    message += "\n\nVideo recording has been stopped and saved."
-                
-                messagebox.showinfo("Experiment Complete", message)
-                return
+        """Start the acquisition worker thread and the Tk pump that plots its samples."""
+        self._samples = queue.Queue(maxsize=1024)  # (times, voltages, currents) batches from the worker
+        self._acq_stop = threading.Event()
+        self._plot_dirty = False
+        self._last_mode = None  # Log the first CV/CC status of the run
+        self._acq_thread = threading.Thread(target=self._acq_loop, name="acquisition", daemon=True)
+        self._acq_thread.start()
+        self._schedule('data', 100, self._pump_samples)
+        self._schedule('display', self.display_period, self._pump_display)
+
+    def _pump_display(self):
+        """Redraw the V/I plot on its own timer, only when new samples have arrived."""
+        if self._plot_dirty:
+            self._plot_dirty = False
+            self.update_smooth_plot()
+        if self.is_plotting:
+            self._schedule('display', self.display_period, self._pump_display)
+
+    def _stop_acq_thread(self, timeout=2.0):
+        """Signal the acquisition worker to stop and wait up to timeout for it; True once it has exited."""
+        if self._acq_thread is None:
+            return True
+        self._acq_stop.set()
+        self._acq_thread.join(timeout=timeout)
+        if self._acq_thread.is_alive():
+            if timeout:
+                self.logger.error("Acquisition worker did not exit in time")
+            return False
+        self._acq_thread = None
+        return True
+
+    def _acq_loop(self):
+        """Worker thread: read the devices every data_period, buffer TSV rows and queue samples."""
+        device = self.controller.device_controller
+        period = self.data_period / 1000.0
+        
+        # One device round-trip per period returns a batch of samples at the flash-stage rate
+        batch_size = max(1, int(round(period / TIMER_PERIODS["data_flash"])))
+        sample_dt = period / batch_size
+        
+        next_tick = time.perf_counter()
+        debug_log_counter = 0
+        prev_current = None  # (time, current) of the newest reading of the previous batch
+        while not self._acq_stop.is_set():
+            try:
+                # Get measurements from device controller
+                with self._device_lock:
+                    voltages, currents, v_times, i_times = device.get_measurements_batch(batch_size, sample_dt)
+               
+                # Skip if readings are invalid
+                if voltages is None or currents is None:
+                    self.logger.warning("Skipping invalid readings")
+                    prev_current = None
+                else:
+                    # Rows are stamped on the DAQ clock. The Keithley is read after the voltage
+                    # window, so current is interpolated to the voltage sample times; the last
+                    # reading of the previous batch brackets the start of this window
+                    times = np.maximum(v_times - self.start_time, 0.0)
+                    i_rel = i_times - self.start_time
+                    if prev_current is not None:
+                        i_rel = np.concatenate(([prev_current[0]], i_rel))
+                        i_vals = np.concatenate(([prev_current[1]], currents))
+                    else:
+                        i_vals = currents
+                    row_currents = np.interp(times, i_rel, i_vals)
+                    voltage, current = voltages[-1], currents[-1]
+                    prev_current = (i_rel[-1], current)
+                    
+                    # Save data to file in batches
+                    with self._file_lock:
+                        if self.data_file is not None:
+                            self._row_buf.extend(zip(times.tolist(), voltages.tolist(), row_currents.tolist()))
+                            if len(self._row_buf) >= self._row_buf_limit:
+                                self._flush_row_buffer()
+                    
+                    # Hand the batch to the Tk thread, dropping the oldest if the GUI falls behind
+                    batch = (times, voltages, row_currents)
+                    try:
+                        self._samples.put_nowait(batch)
+                    except queue.Full:
+                        try:
+                            self._samples.get_nowait()
+                        except queue.Empty:
+                            pass
+                        self._samples.put_nowait(batch)
+                    
+                    # IMPORTANT: Update stage management for hold time functionality
+                    # This ensures CV→CC transition detection and hold time logic runs
+                    if hasattr(device, 'update_stage'):
+                        try:
+                            hold_time = self._hold_time
+                            current_limit = self._current_limit
+                            
+                            # Log current stage and transition info occasionally to avoid spam
+                            if debug_log_counter % 50 == 0:  # Every 50 reads
+                                stage = getattr(device, 'current_stage', 'Unknown')
+                                power_mode = getattr(device, 'power_supply_mode', 'Unknown')
+                                current_percent = (current / current_limit * 100) if current_limit > 0 else 0
+                                self.logger.info(f"Stage: {stage}, Power Mode: {power_mode}, Current: {current:.1f}mA ({current_percent:.1f}% of {current_limit:.1f}mA), Hold Time: {hold_time}s")
+                            debug_log_counter += 1
+                            
+                            # Call stage update with the newest readings of this batch, so the
+                            # instruments are not read a second time per period
+                            with self._device_lock:
+                                device.update_stage(
+                                    dwell_time=0,  # Not used during acquisition
+                                    hold_current=60,  # Not used for hold time limit
+                                    current_limit=current_limit,  # Use the set current limit
+                                    hold_time=hold_time,  # Use the hold time from GUI
+                                    target_temperature=None,
+                                    measurements=(voltage, current, getattr(device, 'last_temperature', None))
+                                )
+                        except Exception as stage_error:
+                            self.logger.debug(f"Stage update error: {stage_error}")
+                    
+                    # The hold time ended the experiment; the Tk pump reports it to the user
+                    if getattr(device, 'experiment_stopped_by_hold_time', False):
+                        break
+            except Exception as e:
+                self.logger.error(f"Error in data acquisition: {e}")
+                break
             
-            # Get measurements from device controller
-            voltage, current, _ = self.controller.device_controller.get_measurements()
-           
-            # Skip if readings are invalid
-            if voltage is None or current is None:
-                self.logger.warning("Skipping invalid readings")
-                if self.is_plotting:
-                    self.data_timer = self.root.after(self.data_period, self.start_data_acquisition)
-                return
-           
-            current_time = time.time() - self.start_time
-           
-            # Add initial point at (0,0) for both voltage and current if this is the first data point
-            if len(self.time_data) == 0:
-                # Add starting point at time=0 with values=0 for clean origin connection
-                self.voltage_data.append(0.0)
-                self.current_data.append(0.0)
-                self.time_data.append(0.0)
-                self.logger.info("Added initial origin point (0,0) for clean graph start")
-           
-            # Store data in arrays with size management
-            self.voltage_data.append(voltage)
-            self.current_data.append(current)
-            self.time_data.append(current_time)
+            # Sleep until the next sample slot; after a slow read, resume from now rather than bursting
+            next_tick += period
+            delay = next_tick - time.perf_counter()
+            if delay < 0:
+                next_tick = time.perf_counter()
+                delay = 0
+            self._acq_stop.wait(delay)
+
+    def _pump_samples(self):
+        """Drain queued samples into the ring buffers; the plot is redrawn by _pump_display."""
+        try:
+            new_samples = False
+            while True:
+                try:
+                    times, voltages, currents = self._samples.get_nowait()
+                except queue.Empty:
+                    break
+               
+                # Add initial point at (0,0) for both voltage and current if this is the first data point
+                if self._count == 0:
+                    # Add starting point at time=0 with values=0 for clean origin connection
+                    self._append_sample(0.0, 0.0, 0.0)
+                    self.logger.info("Added initial origin point (0,0) for clean graph start")
+               
+                # Store data in the ring buffers (oldest non-origin sample is overwritten when full)
+                self._extend_samples(times, voltages, currents)
+                new_samples = True
             
-            # Limit data size for performance
-            if len(self.voltage_data) > self.max_data_points:
-                # Keep the origin point (first point) and remove from middle
-                if len(self.voltage_data) > 1:
-                    self.voltage_data.pop(1)  # Remove second point to preserve origin
-                    self.current_data.pop(1)
-                    self.time_data.pop(1)
-           
-            # Update CV/CC mode display
-            self.update_cv_cc_display()
+            if new_samples:
+                # Update CV/CC mode display
+                self.update_cv_cc_display()
+                self._plot_dirty = True
             
-            # IMPORTANT: Update stage management for hold time functionality
-            # This ensures CV→CC transition detection and hold time logic runs
-            if hasattr(self.controller.device_controller, 'update_stage'):
-                try:
-                    # Get hold time from entry field
-                    hold_time = float(self.Hold_Time_entry.get()) if hasattr(self, 'Hold_Time_entry') else self.hold_time
-                    # Get the current limit that was set at experiment start
-                    current_limit = float(self.current_entry.get()) if hasattr(self, 'current_entry') else 100.0
+            # The worker exits on a hold-time stop or an acquisition error
+            if self._acq_thread is not None and not self._acq_thread.is_alive():
+                # Check if experiment was stopped due to hold time
+                if hasattr(self.controller.device_controller, 'experiment_stopped_by_hold_time') and \
+                   self.controller.device_controller.experiment_stopped_by_hold_time:
+                    self.logger.info("Experiment automatically stopped due to hold time limit reached")
                     
-                    # Log current stage and transition info for debugging
-                    stage = getattr(self.controller.device_controller, 'current_stage', 'Unknown')
-                    power_mode = getattr(self.controller.device_controller, 'power_supply_mode', 'Unknown')
-                    current_percent = (current / current_limit * 100) if current_limit > 0 else 0
+                    # Check if video recording is active and stop it
+                    video_was_recording = hasattr(self, 'is_recording') and self.is_recording
+                    if video_was_recording:
+                        self.logger.info("Stopping video recording due to automatic experiment termination")
+                        self.stop_recording()
                     
-                    # Only log occasionally to avoid spam
-                    if hasattr(self, 'debug_log_counter'):
-                        self.debug_log_counter += 1
-                    else:
-                        self.debug_log_counter = 0
-                        
-                    if self.debug_log_counter % 50 == 0:  # Log every 5 seconds (50 * 100ms)
-                        self.logger.info(f"Stage: {stage}, Power Mode: {power_mode}, Current: {current:.1f}mA ({current_percent:.1f}% of {current_limit:.1f}mA), Hold Time: {hold_time}s")
+                    # Stop GUI data acquisition (same as clicking stop button)
+                    data_filepath = self.data_filepath
+                    self.stop_data_acquisition()
                     
-                    # Call stage update with proper parameters
-                    self.controller.device_controller.update_stage(
-                        dwell_time=0,  # Not used during acquisition
-                        hold_current=60,  # Not used for hold time limit
-                        current_limit=current_limit,  # Use the set current limit
-                        hold_time=hold_time,  # Use the hold time from GUI
-                        target_temperature=None
-                    )
-                except Exception as stage_error:
-                    self.logger.debug(f"Stage update error: {stage_error}")
-           
-            # Save data to file (skip the artificial origin point)
-            if len(self.time_data) > 1:  # Only save real measurements, not the origin point
-                self.data_file.write(f"{current_time:.3f}\t{voltage:.3f}\t{current:.3f}\n")
-                self.data_file.flush()
-           
-            # Update plot every few data points for smooth animation
-            self.plot_update_counter += 1
-            if self.plot_update_counter >= 2:  # Update plot every 2 data points (100ms)
-                self.update_smooth_plot()
-                self.plot_update_counter = 0
-           
-            # Schedule next data acquisition
-            if self.is_plotting:
-                self.data_timer = self.root.after(self.data_period, self.start_data_acquisition)
+                    # Show notification to user with appropriate message
+                    message = (f"Experiment automatically stopped after CV→CC transition hold time was reached.\n\n"
+                              f"Data has been saved to: {os.path.basename(data_filepath) if data_filepath else 'file'}")
+                    
+                    if video_was_recording:
+                        message += "\n\nVideo recording has been stopped and saved."
+                    
+                    messagebox.showinfo("Experiment Complete", message)
+                else:
+                    self.stop_data_acquisition()
+                return
            
         except Exception as e:
             self.logger.error(f"Error in data acquisition: {e}")
             self.stop_data_acquisition()
+            return
+       
+        # Schedule next drain
+        if self.is_plotting:
+            self._schedule('data', 100, self._pump_samples)
+
+    def _reset_buffers(self):
+        """Allocate empty ring buffers for time, voltage and current samples."""
+        n = self.max_data_points
+        self._t = np.empty(n, dtype=np.float64)
+        self._v = np.empty(n, dtype=np.float32)
+        self._i = np.empty(n, dtype=np.float32)
+        self._head = 0   # Next slot to write
+        self._last = 0   # Slot of the newest sample
+        self._count = 0  # Number of valid samples
+
+    def _append_sample(self, t, voltage, current):
+        """Store one sample; once full, overwrite the oldest sample after the origin in slot 0."""
+        h = self._head
+        self._t[h] = t
+        self._v[h] = voltage
+        self._i[h] = current
+        self._last = h
+        self._count = min(self._count + 1, self.max_data_points)
+        self._head = h + 1 if h + 1 < self.max_data_points else 1
+
+    def _extend_samples(self, times, voltages, currents):
+        """Store a batch of samples with the same ring semantics as _append_sample."""
+        n, h = len(times), self._head
+        if h + n > self.max_data_points:
+            # Batch straddles the end of the ring; rare, so keep the wrap logic in one place
+            for sample in zip(times, voltages, currents):
+                self._append_sample(*sample)
+            return
+        self._t[h:h + n] = times
+        self._v[h:h + n] = voltages
+        self._i[h:h + n] = currents
+        self._last = h + n - 1
+        self._count = min(self._count + n, self.max_data_points)
+        self._head = h + n if h + n < self.max_data_points else 1
+
+    def _view(self):
+        """Return (time, voltage, current) arrays in chronological order."""
+        n, h = self._count, self._head
+        if n < self.max_data_points or h == 1:
+            return self._t[:n], self._v[:n], self._i[:n]
+        return tuple(np.concatenate((a[:1], a[h:], a[1:h])) for a in (self._t, self._v, self._i))
+
+    def _downsampled(self, t, n_cols, *series):
+        """Reduce samples to a min/max pair per column; returns x followed by each reduced series."""
+        # Column boundaries by sample count; reduceat handles the uneven last column
+        starts = np.linspace(0, len(t), n_cols, endpoint=False).astype(np.intp)
+        ends = np.append(starts[1:], len(t)) - 1
+        reduced = [np.column_stack((t[starts], t[ends])).ravel()]
+        for y in series:
+            reduced.append(np.column_stack((np.minimum.reduceat(y, starts),
+                                            np.maximum.reduceat(y, starts))).ravel())
+        return reduced
 
     def update_smooth_plot(self):
         """Update plot with compressed timeline showing all data from 0."""
         try:
-            if len(self.time_data) < 2:
+            if self._count < 2:
                 return
                 
+            time_data, voltage_data, current_data = self._view()
+            
             # Apply smoothing to reduce noise
-            smooth_voltage = self.smooth_data(self.voltage_data, self.smoothing_window)
-            smooth_current = self.smooth_data(self.current_data, self.smoothing_window)
+            smooth_voltage = self.smooth_data(voltage_data, self.smoothing_window)
+            smooth_current = self.smooth_data(current_data, self.smoothing_window)
             
             # Apply timeline compression using configured parameters
             compressed_time, compressed_voltage, compressed_current = self.compress_timeline_data(
-                self.time_data, smooth_voltage, smooth_current
+                time_data, smooth_voltage, smooth_current
             )
             
+            # No point drawing more vertices than the canvas has pixels
+            target = max(256, min(self._canvas_px, 1024))
+            
+            if len(compressed_time) >= target:
+                # Already denser than the screen: keep a min/max pair per column so spikes
+                # survive decimation, and skip the spline fit
+                x, v, c = self._downsampled(compressed_time, target // 2,
+                                            compressed_voltage, compressed_current)
+                self.line_voltage.set_data(x, v)
+                self.line_current.set_data(x, c)
             # Apply curve interpolation for smooth plotting lines
-            if len(compressed_time) >= 3:  # Need at least 3 points for interpolation
-                from scipy.interpolate import interp1d
-                
+            elif len(compressed_time) >= 3:  # Need at least 3 points for interpolation
                 # Create interpolation functions
                 try:
-                    # Generate more points for smooth curves
-                    num_smooth_points = min(len(compressed_time) * 3, 1000)  # Increase point density
-                    time_smooth = np.linspace(compressed_time[0], compressed_time[-1], num_smooth_points)
+                    # Generate more points for smooth curves, up to the pixel budget
+                    num_smooth_points = min(len(compressed_time) * 3, target)
+                    if len(self._unit_grid) != num_smooth_points:
+                        self._unit_grid = np.linspace(0.0, 1.0, num_smooth_points)
+                    t0, t1 = compressed_time[0], compressed_time[-1]
+                    time_smooth = t0 + (t1 - t0) * self._unit_grid
                     
-                    # Create cubic spline interpolation for smooth curves
-                    voltage_interp = interp1d(compressed_time, compressed_voltage, kind='cubic', 
-                                            bounds_error=False, fill_value='extrapolate')
-                    current_interp = interp1d(compressed_time, compressed_current, kind='cubic', 
-                                            bounds_error=False, fill_value='extrapolate')
-                    
-                    # Generate smooth interpolated data
-                    voltage_smooth = voltage_interp(time_smooth)
-                    current_smooth = current_interp(time_smooth)
+                    # Monotone PCHIP fit of both channels at once; unlike a cubic
+                    # spline it does not overshoot on noisy steps
+                    interp = PchipInterpolator(compressed_time,
+                                               np.column_stack((compressed_voltage, compressed_current)))
+                    smooth = interp(time_smooth)
                     
                     # Update line data with smooth interpolated curves
-                    self.line_voltage.set_data(time_smooth, voltage_smooth)
-                    self.line_current.set_data(time_smooth, current_smooth)
+                    self.line_voltage.set_data(time_smooth, smooth[:, 0])
+                    self.line_current.set_data(time_smooth, smooth[:, 1])
                     
                 except Exception as interp_error:
                     # Fall back to original data if interpolation fails
@@ -1639,31 +2014,56 @@ class FlashSinterGUI:
                 self.line_voltage.set_data(compressed_time, compressed_voltage)
                 self.line_current.set_data(compressed_time, compressed_current)
             
-            # Add visual separator between compressed and recent data
-            self.add_timeline_separator()
-            
             # Dynamic axis scaling
             if len(compressed_time) > 1:
                 # X-axis: Always start from 0, end at current compressed time
-                x_max = max(compressed_time) if compressed_time else 10
-                self.ax.set_xlim(0, x_max * 1.05)  # 5% padding on right
+                x_max = float(compressed_time[-1])  # Time is sorted, the last point is the largest
+                x_lim = (0, x_max * 1.05)  # 5% padding on right
                 
                 # Voltage axis: auto-scale with padding
-                if len(compressed_voltage) > 0:
-                    v_min, v_max = min(compressed_voltage), max(compressed_voltage)
-                    v_range = v_max - v_min
-                    padding = max(v_range * 0.1, 1.0)  # 10% padding or minimum 1V
-                    self.ax.set_ylim(v_min - padding, v_max + padding)
+                v_min, v_max = float(compressed_voltage.min()), float(compressed_voltage.max())
+                padding = max((v_max - v_min) * 0.1, 1.0)  # 10% padding or minimum 1V
+                v_lim = (v_min - padding, v_max + padding)
+                
+                # Current axis: auto-scale with padding
+                c_min, c_max = float(compressed_current.min()), float(compressed_current.max())
+                padding = max((c_max - c_min) * 0.1, 1.0)  # 10% padding or minimum 1mA
+                c_lim = (c_min - padding, c_max + padding)
+                
+                # An axis needs new limits when its data would be clipped or a bound drifted by >2%
+                x_upd = x_max > self._last_xlim[1] or self._limits_changed(x_lim, self._last_xlim)
+                v_upd = (v_min < self._last_ylim_v[0] or v_max > self._last_ylim_v[1] or
+                         self._limits_changed(v_lim, self._last_ylim_v))
+                c_upd = (c_min < self._last_ylim_c[0] or c_max > self._last_ylim_c[1] or
+                         self._limits_changed(c_lim, self._last_ylim_c))
+                clipped = (x_max > self._last_xlim[1] or v_min < self._last_ylim_v[0] or
+                           v_max > self._last_ylim_v[1] or c_min < self._last_ylim_c[0] or
+                           c_max > self._last_ylim_c[1])
                 
-                # Current axis: auto-scale with padding  
-                if len(compressed_current) > 0:
-                    c_min, c_max = min(compressed_current), max(compressed_current)
-                    c_range = c_max - c_min
-                    padding = max(c_range * 0.1, 1.0)  # 10% padding or minimum 1mA
-                    self.ax2.set_ylim(c_min - padding, c_max + padding)
+                # Re-render the axes only when the data would be clipped, or at most every
+                # 5 s once the limits have drifted; otherwise just blit the two lines
+                now = time.time()
+                if self._plot_bg is None or clipped or ((x_upd or v_upd or c_upd) and
+                                                        now - self._last_full_draw >= 5.0):
+                    # Each set_*lim invalidates the transforms, so only touch axes that moved
+                    if x_upd:
+                        self.ax.set_xlim(*x_lim)
+                        self._last_xlim = x_lim
+                    if v_upd:
+                        self.ax.set_ylim(*v_lim)
+                        self._last_ylim_v = v_lim
+                    if c_upd:
+                        self.ax2.set_ylim(*c_lim)
+                        self._last_ylim_c = c_lim
+                    
+                    # Add visual separator between compressed and recent data
+                    self.add_timeline_separator()
+                    
+                    self._last_full_draw = now
+                    self.canvas.draw_idle()
+                    return
             
-            # Optimized canvas update
-            self.canvas.draw_idle()  # Use draw_idle for better performance
+            self._update_plot_blit()
             
         except Exception as e:
             self.logger.error(f"Error updating compressed timeline plot: {e}")
@@ -1671,31 +2071,21 @@ class FlashSinterGUI:
     def add_timeline_separator(self):
         """Add visual separator between compressed historical and recent data."""
         try:
-            if len(self.time_data) < 2 or not PLOTTING_CONFIG["show_timeline_separator"]:
+            if self._count < 2 or not PLOTTING_CONFIG["show_timeline_separator"]:
                 return
                 
-            current_time = self.time_data[-1]
+            current_time = self._t[self._last]
             
             # Only add separator if we have enough data for compression
             if current_time > self.focus_window:
                 separator_x = self.focus_window * self.compression_ratio  # Position where recent data starts
                 
-                # Remove any existing separator lines
-                for line in self.ax.lines[:]:
-                    if hasattr(line, '_separator_line'):
-                        line.remove()
-                
-                # Add new separator line
-                y_min, y_max = self.ax.get_ylim()
-                separator_line = self.ax.axvline(x=separator_x, color='gray', 
-                                               linestyle='--', alpha=0.5, linewidth=1)
-                separator_line._separator_line = True  # Mark as separator line
-                
-                # Add text annotation
-                self.ax.text(separator_x + 1, y_max * 0.95, 'Recent Data →', 
-                           fontsize=8, color='gray', alpha=0.7)
-                self.ax.text(separator_x - 1, y_max * 0.95, '← Compressed', 
-                           fontsize=8, color='gray', alpha=0.7, ha='right')
+                # Move the persistent separator line and labels into place
+                self._sep_line.set_xdata([separator_x, separator_x])
+                self._sep_lbl_r.set_x(separator_x + 1)
+                self._sep_lbl_l.set_x(separator_x - 1)
+                for artist in (self._sep_line, self._sep_lbl_r, self._sep_lbl_l):
+                    artist.set_visible(True)
                 
         except Exception as e:
             self.logger.error(f"Error adding timeline separator: {e}")
@@ -1703,72 +2093,74 @@ class FlashSinterGUI:
     def add_condition_change_marker(self, new_voltage, new_current):
         """Add visual marker on the plot to show where conditions were changed."""
         try:
-            if len(self.time_data) < 1:
+            if self._count < 1:
                 return
                 
             # Get current time for marker position
-            current_time = self.time_data[-1]
+            current_time = self._t[self._last]
             
             # Apply timeline compression to get the correct x-position
-            compressed_time, _, _ = self.compress_timeline_data(
-                self.time_data, self.voltage_data, self.current_data
-            )
-            marker_x = compressed_time[-1] if compressed_time else current_time
-            
-            # Get current axis limits
-            y_min, y_max = self.ax.get_ylim()
-            y2_min, y2_max = self.ax2.get_ylim()
+            compressed_time, _, _ = self.compress_timeline_data(*self._view())
+            marker_x = compressed_time[-1] if len(compressed_time) else current_time
             
-            # Add vertical line marker
-            marker_line = self.ax.axvline(x=marker_x, color='orange', 
-                                        linestyle=':', alpha=0.8, linewidth=2)
-            marker_line._condition_change_marker = True  # Mark as condition change line
+            # Overwrite the oldest pooled marker slot
+            slot = self._cc_next
+            self._cc_next = (slot + 1) % self.CC_MARKER_SLOTS
+            marker_line = self._cc_lines[slot]
+            marker_line.set_xdata([marker_x, marker_x])
+            marker_line.set_visible(True)
             
-            # Add text annotation
+            # Text annotation sits at 85% of the axes height
             annotation_text = f'Conditions Changed\nV: {new_voltage:.0f}V, I: {new_current:.0f}mA'
-            self.ax.text(marker_x + 1, y_max * 0.85, annotation_text, 
-                       fontsize=8, color='orange', fontweight='bold',
-                       bbox=dict(boxstyle="round,pad=0.3", facecolor='white', 
-                               edgecolor='orange', alpha=0.8))
+            marker_text = self._cc_texts[slot]
+            marker_text.set_x(marker_x + 1)
+            marker_text.set_text(annotation_text)
+            marker_text.set_visible(True)
             
-            # Force immediate canvas update to show the marker
-            self.canvas.draw_idle()
+            # One redraw per burst of condition changes
+            if 'cc_draw' not in self._after_tokens:
+                self._schedule('cc_draw', 500, self._draw_condition_markers)
             
             self.logger.info(f"Added condition change marker at time {current_time:.1f}s")
             
         except Exception as e:
             self.logger.error(f"Error adding condition change marker: {e}")
 
+    def _draw_condition_markers(self):
+        """Redraw the canvas once for all condition change markers placed since the last call."""
+        self._after_tokens.pop('cc_draw', None)
+        self.canvas.draw_idle()
+
     def clear_plot(self):
         """Clear the plot data and reset the display."""
         try:
             # Clear all data arrays
-            self.voltage_data = []
-            self.current_data = []
-            self.time_data = []
+            self._reset_buffers()
             
-            # Reset plot update counter
-            self.plot_update_counter = 0
+            # Nothing left to redraw
+            self._plot_dirty = False
            
-            # Remove any existing condition change markers
-            for line in self.ax.lines[:]:
-                if hasattr(line, '_condition_change_marker'):
-                    line.remove()
-            
-            # Remove any existing text annotations
-            for text in self.ax.texts[:]:
-                if 'Conditions Changed' in text.get_text():
-                    text.remove()
+            # Hide the pooled condition change markers and the timeline separator;
+            # no need to scan every artist
+            for artist in (*self._cc_lines, *self._cc_texts,
+                           self._sep_line, self._sep_lbl_r, self._sep_lbl_l):
+                artist.set_visible(False)
+            self._cc_next = 0
            
-            # Reinitialize professional plot
-            self.setup_professional_plot()
+            # Empty the existing lines and restore the initial limits. Rebuilding the axes here
+            # would recreate the lines and stack another twinx axis on the figure each time
+            self.line_voltage.set_data([], [])
+            self.line_current.set_data([], [])
+            self.ax.set_xlim(0, 10)
+            self.ax.set_ylim(0, 100)
+            self.ax2.set_ylim(0, 100)
+            self._last_xlim, self._last_ylim_v, self._last_ylim_c = (0, 10), (0, 100), (0, 100)
             
-            # Reinitialize line objects
-            self.line_voltage, = self.ax.plot([], [], 'b-', label='Voltage (V)', linewidth=0.5, antialiased=True)
-            self.line_current, = self.ax2.plot([], [], 'r-', label='Current (mA)', linewidth=0.5, antialiased=True)
+            # The next full draw re-captures the blit background
+            self._plot_bg = None
            
-            # Update the canvas
-            self.canvas.draw()
+            # Update the canvas (coalesced with any pending redraw)
+            self.canvas.draw_idle()
            
             self.logger.info("Plot cleared and reinitialized with compressed timeline")
            
@@ -1798,15 +2190,14 @@ class FlashSinterGUI:
             os.makedirs("data", exist_ok=True)
            
             # Write data to file
-            with open(save_path, 'w') as f:
+            with open(save_path, 'w', buffering=self.WRITE_BUF) as f:
                 # Write header
                 f.write("Time(s)\tVoltage(V)\tCurrent(mA)\n")
                
-                # Write data points (every 0.5 seconds)
-                for i in range(0, len(self.voltage_data), 5):  # 5 samples = 0.5s (100ms interval)
-                    if i < len(self.voltage_data):
-                        time_val = i * 0.1  # Convert sample index to time
-                        f.write(f"{time_val:.1f}\t{self.voltage_data[i]:.2f}\t{self.current_data[i]:.2f}\n")
+                # Write every 5th data point, formatted in one savetxt call over strided views
+                time_data, voltage_data, current_data = self._view()
+                rows = np.column_stack((time_data[::5], voltage_data[::5], current_data[::5]))
+                np.savetxt(f, rows, fmt=['%.1f', '%.2f', '%.2f'], delimiter='\t')
            
             self.logger.info(f"Experiment data saved to {save_path}")
             messagebox.showinfo("Save Data", f"Experiment data saved to {save_path}")
@@ -1820,74 +2211,80 @@ class FlashSinterGUI:
         self.is_plotting = False
         self.start_plot_button.configure(text="Start Acquisition")
        
-        # Cancel all timers
-        if self.control_timer:
-            self.root.after_cancel(self.control_timer)
-            self.control_timer = None
-        if self.data_timer:
-            self.root.after_cancel(self.data_timer)
-            self.data_timer = None
-        if self.display_timer:
-            self.root.after_cancel(self.display_timer)
-            self.display_timer = None
+        # Cancel all timers and signal the worker; joining it here would block the Tk loop
+        for key in ('control', 'data', 'display'):
+            self._cancel(key)
+        self._acq_stop.set()
        
         # Clear data arrays
-        self.voltage_data = []
-        self.current_data = []
-        self.time_data = []
+        self._reset_buffers()
         
         # Reset file path so user needs to select file for next experiment
+        data_filepath = self.data_filepath
         self.data_filepath = None
         
         # Reset Start button to neumorphic inactive state since file selection is cleared
-        if hasattr(self, 'start_button_active') and self.start_button_active:
-            inactive_color = "#e0e5ec"
-            self.Start_GUI_button.configure(bg=inactive_color, fg="#333333")  # Default neumorphic colors
-            self.Start_GUI_button.button_frame.configure(bg=inactive_color)
-            self.Start_GUI_button.configure(text="Start")
-            
-            # Update hover effects for inactive neumorphic state
-            def on_enter_inactive(e):
-                self.Start_GUI_button.configure(bg="#d1d9e6")
-                self.Start_GUI_button.button_frame.configure(bg="#d1d9e6")
-            def on_leave_inactive(e):
-                self.Start_GUI_button.configure(bg=inactive_color)
-                self.Start_GUI_button.button_frame.configure(bg=inactive_color)
-           
-            # Remove old bindings and add new ones
-            self.Start_GUI_button.unbind("<Enter>")
-            self.Start_GUI_button.unbind("<Leave>")
-            self.Start_GUI_button.bind("<Enter>", on_enter_inactive)
-            self.Start_GUI_button.bind("<Leave>", on_leave_inactive)
-           
-            self.start_button_active = False
-            # Disable parameter buttons when start button is deactivated
-            self.set_parameter_buttons_state(False)
+        if self.start_button_active:
+            self._set_start_button_active(False)
             self.logger.info("Neumorphic start button reset to inactive state - acquisition stopped")
        
+        # Outputs are zeroed and the file closed once the worker has left the instruments
+        self._acq_stop_deadline = time.time() + 5.0
+        self._finish_stop_acquisition(data_filepath)
+
+    def _finish_stop_acquisition(self, data_filepath):
+        """Zero the outputs and close the data file once the acquisition worker has exited."""
+        self._after_tokens.pop('acq_stop', None)
+        if not self._stop_acq_thread(timeout=0):
+            if time.time() < self._acq_stop_deadline:
+                self._schedule('acq_stop', 50, lambda: self._finish_stop_acquisition(data_filepath))
+                return
+            self.logger.error("Acquisition worker still running after 5 s; stopping the process anyway")
+       
         # Stop the process (set outputs to zero)
         try:
-            self.controller.device_controller.stop_process()
+            # The device lock waits out any read a stuck worker still has in progress
+            with self._device_lock:
+                self.controller.device_controller.stop_process()
             self.logger.info("Stopped process")
            
             # Close data file if it's open
-            if hasattr(self, 'data_file') and self.data_file:
-                self.data_file.close()
-                self.logger.info(f"Closed data file: {self.data_filepath}")
-                messagebox.showinfo("Save Data", f"Experiment data saved to {self.data_filepath}")
+            if self.data_file is not None:
+                self._close_data_file()
+                self.logger.info(f"Closed data file: {data_filepath}")
+                messagebox.showinfo("Save Data", f"Experiment data saved to {data_filepath}")
            
         except Exception as e:
             self.logger.error(f"Failed to stop process: {str(e)}")
 
+    def _flush_row_buffer(self):
+        """Format all buffered data rows and write them to the data file in one call."""
+        with self._file_lock:
+            if self._row_buf:
+                self.data_file.write("".join(starmap(self._ROW_FMT, self._row_buf)))
+                self._row_buf.clear()
+
+    def _close_data_file(self):
+        """Write out buffered rows, sync the data file to disk and close it."""
+        with self._file_lock:
+            if self.data_file is None:
+                return
+            self._flush_row_buffer()
+            self.data_file.flush()
+            os.fsync(self.data_file.fileno())
+            if hasattr(os, 'posix_fadvise'):
+                # Pages are on disk now; let the kernel drop them from the page cache
+                os.posix_fadvise(self.data_file.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            self.data_file.close()
+            self.data_file = None
+
     def export_plot_data(self):
         """Export the current plot data to a CSV file."""
         try:
             # Get data from arrays
-            time_list = self.time_data.copy()
-            voltage_list = self.voltage_data.copy()
-            current_list = self.current_data.copy()
+            time_list, voltage_list, current_list = self._view()
            
-            if not time_list:
+            if not len(time_list):
                 messagebox.showwarning("No Data", "No data available to export.")
                 return
            
@@ -1905,11 +2302,16 @@ class FlashSinterGUI:
             )
            
             if filepath:
-                # Write data to CSV
-                with open(filepath, 'w', newline='') as f:
+                # Write data to CSV in fixed-size blocks so only one block of stacked rows
+                # is held in memory on top of the ring buffers
+                chunk = 8192
+                with open(filepath, 'w', newline='', buffering=self.WRITE_BUF) as f:
                     f.write("Time(s),Voltage(V),Current(mA)\n")
-                    for t, v, c in zip(time_list, voltage_list, current_list):
-                        f.write(f"{t:.3f},{v:.3f},{c:.3f}\n")
+                    for start in range(0, len(time_list), chunk):
+                        end = start + chunk
+                        block = np.column_stack((time_list[start:end], voltage_list[start:end],
+                                                 current_list[start:end]))
+                        np.savetxt(f, block, fmt='%.3f', delimiter=',')
                
                 self.logger.info(f"Data exported to {filepath}")
                 messagebox.showinfo("Success", "Data exported successfully!")
@@ -1923,21 +2325,27 @@ class FlashSinterGUI:
         # Create frame
         frame = self.create_frame(parent, x, y, 300, 200, "Conditions")
        
-        # Sample parameters
+        # Entries share the constraint panel's Tk variables (self._params), so both panels
+        # edit the same sample parameters
         self.create_label(frame, 10, 10, "Electrical Distance (mm):", 12)
-        self.elec_dist_entry = self.create_entry(frame, 150, 10, "0.4", 12)
+        self.elec_dist_entry = self.create_entry(frame, 150, 10, 130, 22,
+                                                 textvariable=self._params["length"])
        
         self.create_label(frame, 10, 40, "Sample Width (mm):", 12)
-        self.width_entry = self.create_entry(frame, 150, 40, "1.6", 12)
+        self.width_entry = self.create_entry(frame, 150, 40, 130, 22,
+                                             textvariable=self._params["width"])
        
         self.create_label(frame, 10, 70, "Sample Thickness (mm):", 12)
-        self.thickness_entry = self.create_entry(frame, 150, 70, "1.0", 12)
+        self.thickness_entry = self.create_entry(frame, 150, 70, 130, 22,
+                                                 textvariable=self._params["thickness"])
        
         self.create_label(frame, 10, 100, "Electric Field (V/mm):", 12)
-        self.field_entry = self.create_entry(frame, 150, 100, "30.0", 12)
+        self.field_entry = self.create_entry(frame, 150, 100, 130, 22,
+                                             textvariable=self._params["e_field"])
        
         self.create_label(frame, 10, 130, "Current Density (mA/mm²):", 12)
-        self.density_entry = self.create_entry(frame, 150, 130, "100.0", 12)
+        self.density_entry = self.create_entry(frame, 150, 130, 130, 22,
+                                               textvariable=self._params["curr_dens"])
        
         # Send Limits button
         self.send_limits_btn = self.create_button(frame, 10, 160, "Send Limits", 12, self.send_limits)
@@ -1946,13 +2354,16 @@ class FlashSinterGUI:
 
     def send_limits(self):
         """Calculate and send voltage/current limits to devices and apply them immediately."""
+        now = time.time()  # Single clock read, used for the data file annotation
         try:
-            # Get values from entries
-            elec_dist = float(self.elec_dist_entry.get())
-            width = float(self.width_entry.get())
-            thickness = float(self.thickness_entry.get())
-            field = float(self.field_entry.get())
-            density = float(self.density_entry.get())
+            # Get values from the Tk variables created with the constraint panel; the field is
+            # per unit length, so V = E*d holds for the panel's cm and V/cm as well
+            params = self._params
+            elec_dist = params["length"].get()
+            width = params["width"].get()
+            thickness = params["thickness"].get()
+            field = params["e_field"].get()
+            density = params["curr_dens"].get()
            
             # Calculate limits
             voltage, current = self.controller.device_controller.calculate_limits_from_parameters(
@@ -1960,7 +2371,8 @@ class FlashSinterGUI:
             )
             
             # Store old values for logging
-            old_voltage, old_current, _ = self.controller.device_controller.get_measurements()
+            with self._device_lock:
+                old_voltage, old_current, _ = self.controller.device_controller.get_measurements()
            
             # Set limits on devices
             if self.controller.device_controller.set_voltage_current_limits(voltage, current):
@@ -1970,19 +2382,21 @@ class FlashSinterGUI:
                 self.current_entry.delete(0, END)
                 self.current_entry.insert(0, f"{current:.2f}")
                 
-                # IMMEDIATELY apply the new voltage/current values
-                self.controller.device_controller.set_voltage_current_limits(voltage, current)
-                self.controller.device_controller.apply_voltage_current_limits()
+                # IMMEDIATELY apply the new voltage/current values (already stored by the set above)
+                with self._device_lock:
+                    self.controller.device_controller.apply_voltage_current_limits()
+                self._current_limit = current
                 
                 # Reset CV/CC tracking for the new conditions
                 self.controller.device_controller.reset_cv_cc_tracking()
                 
                 # Add change marker to data file and plot if acquisition is active
                 if self.is_plotting:
-                    if hasattr(self, 'data_file') and self.data_file:
-                        current_time = time.time() - self.start_time
-                        self.data_file.write(f"# LIMITS CALCULATED AND APPLIED at {current_time:.3f}s: V={old_voltage:.2f}→{voltage:.2f}V, I={old_current:.2f}→{current:.2f}mA\n")
-                        self.data_file.flush()
+                    with self._file_lock:
+                        if self.data_file is not None:
+                            self._flush_row_buffer()  # Keep the marker after the rows it follows
+                            current_time = now - self.start_time
+                            self.data_file.write(f"# LIMITS CALCULATED AND APPLIED at {current_time:.3f}s: V={old_voltage:.2f}→{voltage:.2f}V, I={old_current:.2f}→{current:.2f}mA\n")
                     
                     # Add visual marker on the plot
                     self.add_condition_change_marker(voltage, current)
@@ -2002,6 +2416,7 @@ class FlashSinterGUI:
 
     def change_conditions(self):
         """Change voltage and current limits and immediately apply them during acquisition."""
+        now = time.time()  # Single clock read, used for the data file annotation
         try:
             voltage = float(self.voltage_entry.get())
             current = float(self.current_entry.get())
@@ -2013,12 +2428,15 @@ class FlashSinterGUI:
                 raise ValueError("Current must be between 0 and 2000mA")
                
             # Store the old values for logging
-            old_voltage, old_current, _ = self.controller.device_controller.get_measurements()
+            with self._device_lock:
+                old_voltage, old_current, _ = self.controller.device_controller.get_measurements()
             
             # 1. Set new limits on the controller
             if self.controller.device_controller.set_voltage_current_limits(voltage, current):
                 # 2. IMMEDIATELY apply the new voltage/current values
-                self.controller.device_controller.apply_voltage_current_limits()
+                with self._device_lock:
+                    self.controller.device_controller.apply_voltage_current_limits()
+                self._current_limit = current
                 
                 # 3. Update GUI entry displays to reflect the new values
                 # Values are already updated in the entry fields since user typed them
@@ -2028,10 +2446,11 @@ class FlashSinterGUI:
                 
                 # 5. Add change marker to data file and plot if acquisition is active
                 if self.is_plotting:
-                    if hasattr(self, 'data_file') and self.data_file:
-                        current_time = time.time() - self.start_time
-                        self.data_file.write(f"# CONDITIONS CHANGED at {current_time:.3f}s: V={old_voltage:.2f}→{voltage:.2f}V, I={old_current:.2f}→{current:.2f}mA\n")
-                        self.data_file.flush()
+                    with self._file_lock:
+                        if self.data_file is not None:
+                            self._flush_row_buffer()  # Keep the marker after the rows it follows
+                            current_time = now - self.start_time
+                            self.data_file.write(f"# CONDITIONS CHANGED at {current_time:.3f}s: V={old_voltage:.2f}→{voltage:.2f}V, I={old_current:.2f}→{current:.2f}mA\n")
                     
                     # Add visual marker on the plot
                     self.add_condition_change_marker(voltage, current)
@@ -2060,12 +2479,12 @@ class FlashSinterGUI:
 
     def run_loading(self):
         """Send the forward (loading) command to Arduino."""
-        self.send_command("FWD")
+        self.send_bytes(self._CMD_FWD)
         self.logger.info("Loading (forward) command sent")
 
     def run_unloading(self):
         """Send the reverse (unloading) command to Arduino."""
-        self.send_command("REV")
+        self.send_bytes(self._CMD_REV)
         self.logger.info("Unloading (reverse) command sent")
 
     def run(self):
@@ -1,17 +1,25 @@
 import sys
 import os
+import atexit
+import contextlib
 
 # Add the parent directory to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from gui.flash_sinter_gui import FlashSinterGUI
-
 def main():
     """Main entry point for the flash sintering application."""
     try:
-        # Create and run the GUI
-        app = FlashSinterGUI()
-        app.run()
+        # Imported here so matplotlib, cv2 and the device drivers load only when the app starts
+        from gui.flash_sinter_gui import FlashSinterGUI
+        
+        # Hardware owners register their cleanup on the stack, so devices are released
+        # even if startup fails or the interpreter exits without the window being closed
+        with contextlib.ExitStack() as stack:
+            atexit.register(stack.close)
+            
+            # Create and run the GUI
+            app = FlashSinterGUI(exit_stack=stack)
+            app.run()
     except Exception as e:
         print(f"Error starting application: {e}")
         sys.exit(1)
@@ -0,0 +1,93 @@
+"""Tests for the batched Keithley current read in DeviceController."""
+import logging
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import controllers.device_controller as device_controller
+from controllers.device_controller import DeviceController
+
+
+class FakeKeithley:
+    """Keithley stand-in that records writes and answers the reading-buffer query."""
+    def __init__(self, buffer_reply=None):
+        self.commands = []
+        self.buffer_reply = buffer_reply
+
+    def write(self, command):
+        self.commands.append(command)
+
+    def query(self, command):
+        self.commands.append(command)
+        if self.buffer_reply is None:
+            raise RuntimeError("-113, Undefined header")  # Instrument without defbuffer1
+        return self.buffer_reply
+
+
+class FakeDAQ:
+    """DAQController stand-in whose single reads return a fixed current in microamps."""
+    def __init__(self, keithley, amps):
+        self.keithley = keithley
+        self.amps = amps
+
+    def check_keithley_status(self):
+        return True
+
+    def configure_keithley_current(self):
+        return True
+
+    def read_keithley_current(self):
+        return self.amps * 1e6, 0.01
+
+
+def make_controller(keithley, amps):
+    """Build a DeviceController around fake instruments without touching hardware."""
+    controller = DeviceController.__new__(DeviceController)
+    controller.logger = logging.getLogger(__name__)
+    controller.keithley = keithley
+    controller.daq_controller = FakeDAQ(keithley, amps)
+    controller._keithley_buffered = True
+    return controller
+
+
+@pytest.fixture(autouse=True)
+def visa_available(monkeypatch):
+    monkeypatch.setattr(device_controller, "PYVISA_AVAILABLE", True)
+
+
+def test_fallback_returns_single_read_milliamps():
+    controller = make_controller(FakeKeithley(), amps=0.0015)
+    single, _ = controller.read_keithley_current_improved()
+
+    currents = controller.read_keithley_current_batch(3)
+
+    assert single == pytest.approx(1.5)
+    np.testing.assert_allclose(currents, [single] * 3)
+
+
+def test_fallback_is_permanent_and_restores_count():
+    keithley = FakeKeithley()
+    controller = make_controller(keithley, amps=0.0015)
+
+    controller.read_keithley_current_batch(3)
+    assert not controller._keithley_buffered
+    assert keithley.commands[-1] == ":COUN 1"
+
+    keithley.commands.clear()
+    controller.read_keithley_current_batch(3)
+    assert keithley.commands == []
+
+
+def test_buffered_read_matches_single_read_units():
+    controller = make_controller(FakeKeithley(buffer_reply="0.0015,0.0015"), amps=0.0015)
+    single, _ = controller.read_keithley_current_improved()
+
+    currents = controller.read_keithley_current_batch(2)
+
+    np.testing.assert_allclose(currents, [single] * 2)
+    assert controller._keithley_buffered
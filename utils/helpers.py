@@ -3,12 +3,15 @@
 import time
 from datetime import datetime
 import os
+import numpy as np
 
 def current_time_seconds():
     """Return the current time in seconds since the start of the day.
     """
-    now = datetime.now()
-    return now.hour * 3600 + now.minute * 60 + now.second + now.microsecond/1000000
+    # Local time as in datetime.now(), but from one clock read and a struct_time
+    t = time.time()
+    lt = time.localtime(t)
+    return lt.tm_hour * 3600 + lt.tm_min * 60 + lt.tm_sec + t % 1.0
 
 def elapsed_time(start_time):
     """Calculate elapsed time from start time.
@@ -18,8 +21,7 @@ def elapsed_time(start_time):
 def create_directory_if_not_exists(path):
     """Create directory if it doesn't exist.
     """
-    if not os.path.exists(path):
-        os.makedirs(path)
+    os.makedirs(path, exist_ok=True)
 
 def get_save_filename(base_path, prefix="experiment", extension=".mat"):
     """Generate a unique filename based on timestamp.
@@ -41,6 +43,30 @@ def calculate_current_from_density(current_density, sample_width, sample_thickne
     # current_density in mA/mm^2, dimensions in mm, result in mA
     return current_density * (sample_width * sample_thickness)
 
+def compute_setpoints(length_cm, width_mm, thickness_mm, e_field, current_density):
+    """Calculate voltage and current limits from sample parameters.
+    """
+    # V = E*d (V/cm * cm -> V), I = J*A (mA/mm^2 * mm^2 -> mA)
+    voltage = e_field * length_cm
+    current = current_density * (width_mm * thickness_mm)
+    return voltage, current
+
+def compress_timeline(time_data, split_idx, hist_duration, target_duration, exponent):
+    """Map sample times onto the compressed plot timeline.
+    
+    Times before split_idx are squeezed into [0, target_duration] by a power law;
+    the rest are shifted so the recent window starts at target_duration.
+    """
+    # Plain NumPy ufuncs writing into one output array: numpy's SIMD power beats a
+    # numba loop here, and out= avoids the temporaries of the expression form
+    compressed = np.empty_like(time_data)
+    historical = compressed[:split_idx]
+    np.divide(time_data[:split_idx], hist_duration, out=historical)
+    np.power(historical, exponent, out=historical)
+    historical *= target_duration
+    np.add(time_data[split_idx:], target_duration - hist_duration, out=compressed[split_idx:])
+    return compressed
+
 def clip_value(value, min_val, max_val):
     """Clip a value between min and max.
     """
@@ -1,22 +1,20 @@
 """Logging functionality for the flash sintering control system.
 """
+import functools
 import logging
 import os
 from datetime import datetime
 
-def setup_logger(name):
-    """Set up and return a logger instance"""
+# Session timestamp, computed once so every logger in the process shares one log file name
+_TIMESTAMP = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+@functools.lru_cache(maxsize=None)
+def _shared_handlers():
+    """Create the file and console handlers shared by all setup_logger loggers."""
     # Create logs directory if it doesn't exist
     log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
     os.makedirs(log_dir, exist_ok=True)
-    
-    # Create logger
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
-    
-    # Create handlers
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    log_file = os.path.join(log_dir, f'flash_sinter_{timestamp}.log')
+    log_file = os.path.join(log_dir, f'flash_sinter_{_TIMESTAMP}.log')
     
     file_handler = logging.FileHandler(log_file)
     console_handler = logging.StreamHandler()
@@ -26,9 +24,21 @@ def setup_logger(name):
     file_handler.setFormatter(log_format)
     console_handler.setFormatter(log_format)
     
+    return file_handler, console_handler
+
+def setup_logger(name):
+    """Set up and return a logger instance"""
+    # Create logger
+    logger = logging.getLogger(name)
+    
+    # Already configured by an earlier call; adding handlers again would duplicate output
+    if logger.handlers:
+        return logger
+    logger.setLevel(logging.DEBUG)
+    
     # Add handlers to the logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    for handler in _shared_handlers():
+        logger.addHandler(handler)
     
     return logger
 
@@ -38,17 +48,20 @@ class Logger:
     def __init__(self, log_file=None):
         """Initialize logger.
         """
+        # Configure logger
+        self.logger = logging.getLogger("flash_sintering")
+        
+        # Already configured by an earlier instance; adding handlers again would duplicate output
+        if self.logger.handlers:
+            return
+        
         if log_file is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            log_file = f"flash_sintering_{timestamp}.log"
+            log_file = f"flash_sintering_{_TIMESTAMP}.log"
 
         # Create logs directory if it doesn't exist
-        if not os.path.exists("logs"):
-            os.makedirs("logs")
+        os.makedirs("logs", exist_ok=True)
         log_file = os.path.join("logs", log_file)
 
-        # Configure logger
-        self.logger = logging.getLogger("flash_sintering")
         self.logger.setLevel(logging.DEBUG)
 
         # Create file handler